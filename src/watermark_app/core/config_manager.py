@@ -90,10 +90,12 @@ class ConfigManager:
         # 尝试在当前工作目录创建配置文件夹
         current_dir = Path.cwd() / '.watermark_config'
         current_dir.mkdir(exist_ok=True)
-        # 测试是否可写
-        test_file = current_dir / '.test'
-        test_file.write_text('test')
-        test_file.unlink()
+        # 已有配置文件说明之前已成功写入过此目录，不必每次启动都写测试文件
+        if not (current_dir / 'config.json').exists():
+          # 测试是否可写
+          test_file = current_dir / '.test'
+          test_file.write_text('test')
+          test_file.unlink()
         self.config_dir = current_dir
         self.logger.info(f"使用当前目录保存配置: {self.config_dir}")
       except (PermissionError, OSError):
@@ -111,6 +113,12 @@ class ConfigManager:
     # 当前配置
     self.config = copy.deepcopy(self.DEFAULT_CONFIG)
     self.templates = {}
+    # 已载入的模板文件修改时间，文件未变时重复载入直接复用内存中的模板
+    self._templates_mtime: Optional[float] = None
+    # get_template_list的结果缓存，模板增删改或重新载入时失效
+    self._template_list_cache: Optional[List[Dict[str, Any]]] = None
+    # 每个文件上次写入的JSON字节，内容未变化时不重复写盘
+    self._written_blobs: Dict[Path, bytes] = {}
 
     # 加载配置
     self.load_config()
@@ -147,9 +155,8 @@ class ConfigManager:
         bool: 是否成功保存
     """
     try:
-      with open(self.config_file, 'w', encoding='utf-8') as f:
-        json.dump(self.config, f, indent=2, ensure_ascii=False)
-      self.logger.info("成功保存配置文件")
+      if self._write_json(self.config_file, self.config):
+        self.logger.info("成功保存配置文件")
       return True
     except Exception as e:
       self.logger.error(f"保存配置文件失败: {str(e)}")
@@ -164,15 +171,23 @@ class ConfigManager:
     """
     try:
       if self.templates_file.exists():
+        mtime = self.templates_file.stat().st_mtime
+        if mtime == self._templates_mtime:
+          return True
         with open(self.templates_file, 'r', encoding='utf-8') as f:
           self.templates = json.load(f)
           self.logger.info(f"成功加载 {len(self.templates)} 个水印模板")
+        self._templates_mtime = mtime
       else:
         self.templates = {}
+        self._templates_mtime = None
+      self._template_list_cache = None
       return True
     except Exception as e:
       self.logger.error(f"加载模板文件失败: {str(e)}")
       self.templates = {}
+      self._templates_mtime = None
+      self._template_list_cache = None
       return False
 
   def save_templates(self) -> bool:
@@ -182,10 +197,13 @@ class ConfigManager:
     Returns:
         bool: 是否成功保存
     """
+    # 内存中的模板已经改变，列表缓存随之失效
+    self._template_list_cache = None
     try:
-      with open(self.templates_file, 'w', encoding='utf-8') as f:
-        json.dump(self.templates, f, indent=2, ensure_ascii=False)
-      self.logger.info("成功保存模板文件")
+      if self._write_json(self.templates_file, self.templates):
+        # 记录写入后的修改时间，之后的load_templates无需重新解析自己写的文件
+        self._templates_mtime = self.templates_file.stat().st_mtime
+        self.logger.info("成功保存模板文件")
       return True
     except Exception as e:
       self.logger.error(f"保存模板文件失败: {str(e)}")
@@ -405,20 +423,22 @@ class ConfigManager:
 
   def get_template_list(self) -> List[Dict[str, Any]]:
     """
-    获取模板列表
+    获取模板列表（模板未变化时复用缓存的列表）
 
     Returns:
         模板信息列表
     """
-    return [
-        {
-            'name': name,
-            'description': template.get('description', ''),
-            'created_time': template.get('created_time', 0),
-            'modified_time': template.get('modified_time', 0)
-        }
-        for name, template in self.templates.items()
-    ]
+    if self._template_list_cache is None:
+      self._template_list_cache = [
+          {
+              'name': name,
+              'description': template.get('description', ''),
+              'created_time': template.get('created_time', 0),
+              'modified_time': template.get('modified_time', 0)
+          }
+          for name, template in self.templates.items()
+      ]
+    return list(self._template_list_cache)
 
   def export_template(self, name: str, file_path: str) -> bool:
     """
@@ -436,8 +456,9 @@ class ConfigManager:
         self.logger.error(f"模板不存在: {name}")
         return False
 
-      with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(self.templates[name], f, indent=2, ensure_ascii=False)
+      blob = json.dumps(self.templates[name], indent=2,
+                        ensure_ascii=False).encode('utf-8')
+      self._atomic_write(Path(file_path), blob)
 
       self.logger.info(f"成功导出模板: {name} -> {file_path}")
       return True
@@ -482,6 +503,41 @@ class ConfigManager:
       self.logger.error(f"导入模板失败: {str(e)}")
       return False
 
+  def _write_json(self, file_path: Path, data: Dict[str, Any]) -> bool:
+    """
+    将数据一次性序列化后写入JSON文件
+
+    Args:
+        file_path: 文件路径
+        data: 要写入的数据
+
+    Returns:
+        bool: 是否实际写入（内容与上次写入相同且文件仍存在时跳过）
+    """
+    blob = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    if self._written_blobs.get(file_path) == blob and file_path.exists():
+      return False
+    self._atomic_write(file_path, blob)
+    self._written_blobs[file_path] = blob
+    return True
+
+  @staticmethod
+  def _atomic_write(file_path: Path, blob: bytes):
+    """
+    先写入同目录临时文件再原子替换，写入中断时不会留下残缺的文件
+
+    Args:
+        file_path: 目标文件路径
+        blob: 文件内容
+    """
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+      tmp_path.write_bytes(blob)
+      os.replace(tmp_path, file_path)
+    except BaseException:
+      tmp_path.unlink(missing_ok=True)
+      raise
+
   def _merge_config(self, default: Dict, loaded: Dict):
     """
     合并配置，保留默认值结构
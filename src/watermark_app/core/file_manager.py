@@ -9,7 +9,8 @@ import os
 import logging
 from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
-import mimetypes
+
+from ..utils.constants import SUPPORTED_IMAGE_EXTENSIONS, SUPPORTED_MIME_TYPES
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +19,10 @@ class FileManager:
   """文件管理器类"""
 
   # 支持的图片MIME类型
-  SUPPORTED_MIME_TYPES = {
-      'image/jpeg', 'image/jpg', 'image/png',
-      'image/bmp', 'image/tiff', 'image/x-ms-bmp'
-  }
+  SUPPORTED_MIME_TYPES = SUPPORTED_MIME_TYPES
 
   # 支持的文件扩展名
-  SUPPORTED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
+  SUPPORTED_EXTENSIONS = SUPPORTED_IMAGE_EXTENSIONS
 
   def __init__(self):
     """初始化文件管理器"""
@@ -66,17 +64,8 @@ class FileManager:
         bool: 是否为支持的图片文件
     """
     try:
-      # 检查文件扩展名
-      ext = Path(file_path).suffix.lower()
-      if ext not in self.SUPPORTED_EXTENSIONS:
-        return False
-
-      # 检查MIME类型
-      mime_type, _ = mimetypes.guess_type(file_path)
-      if mime_type and mime_type.lower() in self.SUPPORTED_MIME_TYPES:
-        return True
-
-      return ext in self.SUPPORTED_EXTENSIONS
+      # 只需检查扩展名：扩展名受支持时，无论MIME类型猜测结果如何都判定为图片
+      return Path(file_path).suffix.lower() in self.SUPPORTED_EXTENSIONS
 
     except Exception as e:
       self.logger.error(f"检查文件类型失败 {file_path}: {str(e)}")
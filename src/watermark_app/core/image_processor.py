@@ -11,15 +11,15 @@ from typing import Optional, Tuple, List
 from PIL import Image, ImageTk
 import tkinter as tk
 
+from ..utils.constants import SUPPORTED_IMAGE_EXTENSIONS
+
 logger = logging.getLogger(__name__)
 
 class ImageProcessor:
     """图像处理器类"""
     
     # 支持的图片格式
-    SUPPORTED_FORMATS = {
-        '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'
-    }
+    SUPPORTED_FORMATS = SUPPORTED_IMAGE_EXTENSIONS
     
     def __init__(self):
         """初始化图像处理器"""
@@ -6,6 +6,7 @@
 """
 
 import logging
+import functools
 from typing import Optional, Tuple, Union
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import os
@@ -14,6 +15,12 @@ from ..utils.font_mapper import get_font_path
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _truetype(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+  """加载TrueType字体并缓存，相同字体和字号不再重复解析字体文件"""
+  return ImageFont.truetype(font_path, font_size)
+
+
 class WatermarkProcessor:
   """水印处理器类"""
 
@@ -48,7 +55,7 @@ class WatermarkProcessor:
       # 4. 加载字体
       if font_path:
         try:
-          font = ImageFont.truetype(font_path, font_size)
+          font = _truetype(font_path, font_size)
           self.logger.info(f"成功加载字体: {font_path}")
           return font
 
@@ -72,7 +79,7 @@ class WatermarkProcessor:
       for fallback in fallback_fonts:
         try:
           if os.path.exists(fallback):
-            font = ImageFont.truetype(fallback, font_size)
+            font = _truetype(fallback, font_size)
             self.logger.info(f"使用备用字体: {fallback}")
             return font
         except Exception:
@@ -423,7 +430,8 @@ class WatermarkProcessor:
         return watermark
 
       # 旋转水印，保持透明背景
-      rotated = watermark.rotate(angle, expand=True, fillcolor=(0, 0, 0, 0))
+      rotated = watermark.rotate(angle, resample=Image.Resampling.BILINEAR,
+                                 expand=True, fillcolor=(0, 0, 0, 0))
       return rotated
 
     except Exception as e:
@@ -445,31 +453,35 @@ class WatermarkProcessor:
         应用水印后的图像
     """
     try:
-      # 复制基础图像
-      result = base_image.copy()
-
-      # 确保基础图像有透明通道
-      if result.mode != 'RGBA':
-        result = result.convert('RGBA')
-
       # 处理水印透明度
-      watermark_copy = watermark.copy()
+      watermark_copy = watermark
+      if watermark_copy.mode != 'RGBA':
+        watermark_copy = watermark_copy.convert('RGBA')
       if opacity < 1.0:
+        watermark_copy = watermark_copy.copy()
         alpha = watermark_copy.split()[-1]
         alpha = alpha.point(lambda p: int(p * opacity))
         watermark_copy.putalpha(alpha)
 
       # 计算粘贴位置，确保水印不超出图像边界
       x, y = position
-      img_width, img_height = result.size
+      img_width, img_height = base_image.size
       wm_width, wm_height = watermark_copy.size
 
       # 调整位置确保水印完全在图像内
       x = max(0, min(x, img_width - wm_width))
       y = max(0, min(y, img_height - wm_height))
 
-      # 应用水印
-      result.paste(watermark_copy, (x, y), watermark_copy)
+      # 只在水印覆盖的区域内做alpha合成，无需将整张图转换为RGBA
+      box = (x, y, x + wm_width, y + wm_height)
+      region = base_image.crop(box)
+      if region.mode != 'RGBA':
+        region = region.convert('RGBA')
+      composed = Image.alpha_composite(region, watermark_copy)
+
+      # 复制基础图像并写回合成后的区域（保持原图模式）
+      result = base_image.copy()
+      result.paste(composed, box)
 
       self.logger.info(f"成功应用水印，位置: ({x}, {y})")
       return result
@@ -6,6 +6,7 @@
 
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import logging
 from ...utils.constants import APP_NAME, APP_VERSION, APP_AUTHOR, APP_DESCRIPTION
 
@@ -44,21 +45,41 @@ class AboutDialog:
           self.dialog, orient="vertical", command=canvas.yview)
       scrollable_frame = ttk.Frame(canvas)
 
-      scrollable_frame.bind(
-          "<Configure>",
-          lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-      )
-
       canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
       canvas.configure(yscrollcommand=scrollbar.set)
 
-      # 鼠标滚轮支持
+      # 窗口缩放时连续的<Configure>合并到空闲时处理一次：画布上只有这一个
+      # 窗口项，滚动区域直接取框架尺寸；内容放得下时隐藏滚动条
+      scroll_state = {'after_id': None, 'overflow': False}
+
+      def _update_scroll():
+        scroll_state['after_id'] = None
+        width = scrollable_frame.winfo_width()
+        height = scrollable_frame.winfo_height()
+        canvas.configure(scrollregion=(0, 0, width, height))
+        overflow = height > canvas.winfo_height()
+        if overflow != scroll_state['overflow']:
+          scroll_state['overflow'] = overflow
+          if overflow:
+            scrollbar.pack(side="right", fill="y")
+          else:
+            scrollbar.pack_forget()
+            canvas.yview_moveto(0)
+
+      def _schedule_scroll_update(event=None):
+        if scroll_state['after_id'] is None:
+          scroll_state['after_id'] = self.dialog.after_idle(_update_scroll)
+
+      scrollable_frame.bind("<Configure>", _schedule_scroll_update)
+      canvas.bind("<Configure>", _schedule_scroll_update)
+
+      # 鼠标滚轮支持（内容放得下时不滚动）
       def _on_mousewheel(event):
-        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        if scroll_state['overflow']:
+          canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
       canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
       canvas.pack(side="left", fill="both", expand=True)
-      scrollbar.pack(side="right", fill="y")
 
       # 主框架(在可滚动框架内)
       main_frame = ttk.Frame(scrollable_frame, padding=30)
@@ -117,14 +138,29 @@ class AboutDialog:
           "✓ 多种导出格式和质量选项",
       ]
 
-      for feature in features:
-        feature_label = ttk.Label(
-            features_frame,
-            text=feature,
-            font=("Microsoft YaHei UI", 9),
-            foreground="#2c3e50"
-        )
-        feature_label.pack(anchor=tk.W, pady=2)
+      # 所有特性放在同一个只读文本控件中，不必为每一行单独创建控件；
+      # 每行上下各留2像素，与原先逐行标签的pady=2间距一致
+      features_font = tkfont.Font(features_frame, family="Microsoft YaHei UI", size=9)
+      features_text = tk.Text(
+          features_frame,
+          font=features_font,
+          foreground="#2c3e50",
+          background=ttk.Style().lookup('TLabelframe', 'background') or None,
+          width=max(features_font.measure(feature) for feature in features)
+          // max(1, features_font.measure('0')) + 1,
+          height=len(features),
+          spacing1=2,
+          spacing3=2,
+          wrap=tk.NONE,
+          relief=tk.FLAT,
+          borderwidth=0,
+          highlightthickness=0,
+          takefocus=0,
+          cursor=""
+      )
+      features_text.insert('1.0', "\n".join(features))
+      features_text.config(state=tk.DISABLED)
+      features_text.pack(anchor=tk.W)
 
       # 分隔线
       separator2 = ttk.Separator(main_frame, orient=tk.HORIZONTAL)
@@ -22,6 +22,8 @@ class HelpDialog:
     self.parent = parent
     self.logger = logging.getLogger(__name__)
     self.dialog = None
+    # 对话框是否显示中；关闭时只隐藏窗口，再次打开直接复用已构建的内容
+    self._visible = None
     self._create_dialog()
 
   def _create_dialog(self):
@@ -36,6 +38,10 @@ class HelpDialog:
       # 居中显示
       self.dialog.transient(self.parent)
       self._center_window()
+      self.dialog.protocol("WM_DELETE_WINDOW", self._close)
+      self._visible = tk.BooleanVar(self.dialog, value=False)
+      # 主窗口关闭时对话框随之销毁，需结束show中的等待
+      self.dialog.bind('<Destroy>', self._on_destroy, add='+')
 
       # 创建笔记本标签页
       notebook = ttk.Notebook(self.dialog)
@@ -60,7 +66,7 @@ class HelpDialog:
       ttk.Button(
           button_frame,
           text="关闭",
-          command=self.dialog.destroy,
+          command=self._close,
           width=15
       ).pack(side=tk.RIGHT)
 
@@ -430,9 +436,31 @@ A: 建议:
     y = (self.dialog.winfo_screenheight() // 2) - (height // 2)
     self.dialog.geometry(f'{width}x{height}+{x}+{y}')
 
+  def is_alive(self) -> bool:
+    """对话框窗口是否仍然存在（可再次显示）"""
+    return bool(self.dialog) and bool(self.dialog.winfo_exists())
+
+  def _close(self):
+    """关闭对话框（隐藏窗口以便复用）"""
+    self.dialog.grab_release()
+    self.dialog.withdraw()
+    self._visible.set(False)
+
+  def _on_destroy(self, event):
+    """对话框窗口被销毁（<Destroy>也会在子控件销毁时触发，只处理窗口本身）"""
+    if event.widget is not self.dialog:
+      return
+    try:
+      self._visible.set(False)
+    except tk.TclError:
+      pass
+
   def show(self):
-    """显示对话框"""
+    """显示对话框，直到用户关闭"""
     if self.dialog:
+      self.dialog.deiconify()
+      self.dialog.lift()
+      self._visible.set(True)
       self.dialog.grab_set()
       self.dialog.focus_set()
-      self.dialog.wait_window()
+      self.dialog.wait_variable(self._visible)
@@ -7,7 +7,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,8 @@ class TemplateDialog:
     self.config_manager = config_manager
     self.logger = logging.getLogger(__name__)
     self.result = None
+    # 列表框当前显示的模板名称，名称未变化时不重建列表
+    self._listed_names: Tuple[str, ...] = ()
 
     # 创建对话框
     self._create_dialog(title)
@@ -121,12 +123,16 @@ class TemplateDialog:
       self.logger.error(f"创建模板对话框界面失败: {str(e)}")
 
   def _load_template_list(self):
-    """加载模板列表"""
+    """加载模板列表（名称未变化时保留现有列表和选中状态）"""
     try:
+      names = tuple(template['name']
+                    for template in self.config_manager.get_template_list())
+      if names == self._listed_names:
+        return
+      self._listed_names = names
       self.template_listbox.delete(0, tk.END)
-      templates = self.config_manager.get_template_list()
-      for template in templates:
-        self.template_listbox.insert(tk.END, template['name'])
+      if names:
+        self.template_listbox.insert(tk.END, *names)
     except Exception as e:
       self.logger.error(f"加载模板列表失败: {str(e)}")
 
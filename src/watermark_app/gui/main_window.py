@@ -8,14 +8,20 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 import logging
 import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from typing import Optional, List, Dict, Any
 from pathlib import Path
+from PIL import Image
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
 from ..core import ImageProcessor, WatermarkProcessor, FileManager, ConfigManager, ImageExporter
 from ..utils.constants import *
 from ..utils.font_mapper import get_font_path
-from ..utils.helpers import center_window, get_system_fonts
+from ..utils.helpers import center_window, get_system_fonts, hex_to_rgb
 from .widgets.image_list_panel import ImageListPanel
 from .widgets.preview_panel import PreviewPanel
 from .widgets.watermark_control_panel import WatermarkControlPanel
@@ -32,6 +38,23 @@ logger = logging.getLogger(__name__)
 class MainWindow:
   """主窗口类"""
 
+  # 字体名称到常见字体文件名片段的映射（用于匹配字体文件）
+  _FONT_FILE_ALIASES = {
+      '微软雅黑': ('msyh', 'microsoftyahei', 'yahei'),
+      '宋体': ('simsun', 'nsimsun'),
+      '黑体': ('simhei', 'hei'),
+      '仿宋': ('simfang', 'fangsong'),
+      '楷体': ('simkai', 'kai'),
+      'arial': ('arial',),
+      'times new roman': ('times', 'timesnr'),
+      'calibri': ('calibri',),
+      'helvetica': ('helvetica', 'helv'),
+      'courier new': ('courier', 'cour')
+  }
+
+  # 常见字体文件扩展名
+  _FONT_FILE_PATTERNS = ('*.ttf', '*.ttc', '*.otf', '*.woff', '*.woff2')
+
   def __init__(self, root: tk.Tk):
     """
     初始化主窗口
@@ -54,12 +77,30 @@ class MainWindow:
     self.preview_panel = None
     self.watermark_control_panel = None
     self.position_control_panel = None
+    # 使用说明对话框内容较多，首次打开时构建，之后隐藏复用
+    self._help_dialog = None
 
     # 状态变量
     self.current_image_index = -1
     self.current_image = None
     self.current_preview_image = None
 
+    # 预览刷新调度（合并短时间内的多次设置变更）
+    self._preview_after_id = None
+    self._batch_depth = 0
+    self._batch_dirty = False
+
+    # 已生成的水印图块缓存（仅位置变化时无需重新绘制文字）
+    # 批量导出时会在工作线程中访问，需加锁
+    self._watermark_cache = OrderedDict()
+    self._watermark_cache_lock = threading.Lock()
+
+    # 上一次渲染预览所用的原图和配置，未变化时跳过渲染
+    self._last_preview_source = None
+    self._last_preview_key = None
+    # 拖动滑块时使用的缩小底图：(原图, 缩小后的图像)
+    self._draft_base = None
+
     # 初始化界面
     self._setup_window()
     self._create_menu()
@@ -129,9 +170,9 @@ class MainWindow:
           label="清空列表", command=self._on_clear_list, accelerator="Ctrl+Delete")
       edit_menu.add_separator()
       edit_menu.add_command(
-          label="上一张图片", command=lambda: self._on_image_switch('prev'), accelerator="←")
+          label="上一张图片", command=partial(self._on_image_switch, 'prev'), accelerator="←")
       edit_menu.add_command(
-          label="下一张图片", command=lambda: self._on_image_switch('next'), accelerator="→")
+          label="下一张图片", command=partial(self._on_image_switch, 'next'), accelerator="→")
       edit_menu.add_separator()
       edit_menu.add_command(
           label="复制水印设置", command=self._copy_watermark_settings)
@@ -297,12 +338,14 @@ class MainWindow:
       # 应用水印配置到控制面板
       watermark_config = self.config_manager.get_watermark_config()
 
-      if self.watermark_control_panel:
-        self.watermark_control_panel.load_config(watermark_config)
+      # 两个面板的载入通知合并为一次预览刷新
+      with self._batch_updates():
+        if self.watermark_control_panel:
+          self.watermark_control_panel.load_config(watermark_config)
 
-      if self.position_control_panel:
-        self.position_control_panel.load_config(
-            watermark_config.get('position', {}))
+        if self.position_control_panel:
+          self.position_control_panel.load_config(
+              watermark_config.get('position', {}))
 
     except Exception as e:
       self.logger.error(f"加载配置失败: {str(e)}")
@@ -422,7 +465,7 @@ class MainWindow:
 
   def _on_watermark_change(self):
     """水印设置改变事件"""
-    self._update_preview()
+    self._schedule_preview_update()
 
   def _on_watermark_position_change(self, position=None):
     """水印位置改变事件"""
@@ -432,8 +475,42 @@ class MainWindow:
         # 设置为自定义位置
         self.position_control_panel.set_custom_position(
             position[0], position[1])
+    self._schedule_preview_update()
+
+  def _schedule_preview_update(self, delay: int = 50):
+    """
+    延迟刷新预览，连续的设置变更只触发最后一次渲染
+
+    Args:
+        delay: 延迟时间（毫秒）
+    """
+    if self._batch_depth > 0:
+      # 批量更新中，只记录需要刷新，退出批量时统一刷新
+      self._batch_dirty = True
+      return
+
+    if self._preview_after_id:
+      self.root.after_cancel(self._preview_after_id)
+    self._preview_after_id = self.root.after(
+        delay, self._run_scheduled_preview)
+
+  def _run_scheduled_preview(self):
+    """执行已调度的预览刷新"""
+    self._preview_after_id = None
     self._update_preview()
 
+  @contextmanager
+  def _batch_updates(self):
+    """批量更新上下文，期间的预览刷新请求合并为退出时的一次（可嵌套）"""
+    self._batch_depth += 1
+    try:
+      yield
+    finally:
+      self._batch_depth -= 1
+      if self._batch_depth == 0 and self._batch_dirty:
+        self._batch_dirty = False
+        self._schedule_preview_update()
+
   def _update_preview(self):
     """更新预览"""
     try:
@@ -449,21 +526,113 @@ class MainWindow:
       if self.position_control_panel:
         position_config = self.position_control_panel.get_config()
 
+      # 拖动滑块期间按当前显示比例合成低分辨率预览，松开后再按原图渲染
+      draft_scale = self._get_draft_scale()
+
+      # 原图和配置都未变化时无需重新渲染；图片水印文件被原地修改时
+      # 其修改时间随之变化，与水印图块缓存在同样条件下失效
+      watermark_mtime = None
+      if watermark_config.get('type') == 'image':
+        watermark_mtime = self._get_file_mtime(
+            watermark_config.get('image', {}).get('path', ''))
+      preview_key = (self._freeze_config(watermark_config),
+                     self._freeze_config(position_config),
+                     watermark_mtime,
+                     draft_scale is not None)
+      if (self.current_image is self._last_preview_source and
+              preview_key == self._last_preview_key):
+        return
+
       # 生成水印预览
       preview_image, watermark_bounds = self._apply_watermark_to_image(
-          self.current_image, watermark_config, position_config, return_bounds=True)
+          self.current_image, watermark_config, position_config,
+          return_bounds=True, draft_scale=draft_scale)
 
       if preview_image:
-        self.current_preview_image = preview_image
+        source_size = None
+        if draft_scale is None:
+          # 保存当前图片时使用的是原图分辨率的预览
+          self.current_preview_image = preview_image
+          self._draft_base = None
+        else:
+          source_size = self.current_image.size
+        self._last_preview_source = self.current_image
+        self._last_preview_key = preview_key
 
         # 生成图片信息
         image_info = self._get_current_image_info()
         self.preview_panel.update_preview(
-            preview_image, image_info, watermark_bounds)
+            preview_image, image_info, watermark_bounds, source_size)
 
     except Exception as e:
       self.logger.error(f"更新预览失败: {str(e)}")
 
+  def _get_draft_scale(self) -> Optional[float]:
+    """
+    获取拖动滑块期间低分辨率预览的缩放比例
+
+    Returns:
+        预览面板当前的显示比例，未在拖动或无需缩小时返回None
+    """
+    dragging = any(panel and panel.is_dragging() for panel in (
+        self.watermark_control_panel, self.position_control_panel))
+    if not dragging:
+      return None
+    scale = self.preview_panel.scale_factor
+    return scale if 0 < scale < 1.0 else None
+
+  def _get_draft_base(self, image, scale: float):
+    """
+    获取低分辨率预览的底图，同一张原图在一次拖动中只缩小一次
+
+    Args:
+        image: 原图
+        scale: 缩放比例
+
+    Returns:
+        缩小后的底图
+    """
+    if self._draft_base and self._draft_base[0] is image:
+      return self._draft_base[1]
+    size = (max(1, round(image.width * scale)),
+            max(1, round(image.height * scale)))
+    base = image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+    self._draft_base = (image, base)
+    return base
+
+  def _get_file_mtime(self, file_path: str) -> Optional[float]:
+    """
+    获取文件修改时间
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        修改时间，路径为空或文件不存在时返回None
+    """
+    if not file_path:
+      return None
+    try:
+      return os.path.getmtime(file_path)
+    except OSError:
+      return None
+
+  def _freeze_config(self, value):
+    """
+    将配置转换为可比较、可哈希的嵌套元组
+
+    Args:
+        value: 配置字典或其中的值
+
+    Returns:
+        冻结后的配置
+    """
+    if isinstance(value, dict):
+      return tuple(sorted((k, self._freeze_config(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+      return tuple(self._freeze_config(v) for v in value)
+    return value
+
   def _get_current_image_info(self) -> str:
     """
     获取当前图片信息字符串
@@ -492,8 +661,14 @@ class MainWindow:
       self.logger.error(f"获取图片信息失败: {str(e)}")
       return ""
 
-  def _apply_watermark_to_image(self, image, watermark_config, position_config, return_bounds=False):
-    """应用水印到图像"""
+  def _apply_watermark_to_image(self, image, watermark_config, position_config, return_bounds=False,
+                                draft_scale=None):
+    """
+    应用水印到图像
+
+    draft_scale不为None时，水印按原图计算尺寸和位置后缩小，合成到按该比例
+    缩小的底图上（拖动滑块时的低分辨率预览），返回的边界仍是原图坐标
+    """
     try:
       if not image:
         return (image, None) if return_bounds else image
@@ -502,12 +677,13 @@ class MainWindow:
       if not watermark_config or watermark_config.get('type') not in ['text', 'image']:
         return (image, None) if return_bounds else image
 
-      # 创建图像副本避免修改原图
-      result_image = image.copy()
+      # 原图只读，真正写入像素时由apply_watermark生成副本
+      result_image = image
       watermark_bounds = None  # (x, y, width, height)
 
       # 根据水印类型生成水印
       watermark = None
+      cache_key = None
 
       if watermark_config.get('type') == 'text':
         # 文本水印
@@ -527,7 +703,7 @@ class MainWindow:
         # 转换颜色格式
         try:
           # 将十六进制颜色转换为RGB
-          color_rgb = tuple(int(color_hex[i:i+2], 16) for i in (1, 3, 5))
+          color_rgb = hex_to_rgb(color_hex)
           alpha = int(opacity * 255)
           color = (*color_rgb, alpha)
         except:
@@ -540,31 +716,37 @@ class MainWindow:
         # 描边颜色
         stroke_color = (0, 0, 0, 255) if stroke_enabled else None
 
-        # 获取字体路径或字体名称
-        # 优先使用字体映射器（支持粗体斜体）
-        font_path = get_font_path(font_family, bold, italic)
-        if not font_path:
-            # 如果映射器没找到，尝试原有方法
-          font_path = self._get_font_path(font_family)
-        # 如果仍然没有找到字体文件，直接使用字体名称
-        if not font_path:
-          font_path = font_family
-
-        self.logger.debug(f"字体映射: {font_family} -> {font_path}")
-
-        watermark = self.watermark_processor.create_text_watermark(
-            text=text_content,
-            font_path=font_path,
-            font_size=font_size,
-            color=color,
-            shadow=shadow_enabled,
-            shadow_offset=(2, 2),
-            shadow_color=shadow_color,
-            stroke_width=stroke_width,
-            stroke_color=stroke_color,
-            bold=bold,
-            italic=italic
-        )
+        def create_text_watermark():
+          # 获取字体路径或字体名称
+          # 优先使用字体映射器（支持粗体斜体）
+          font_path = get_font_path(font_family, bold, italic)
+          if not font_path:
+              # 如果映射器没找到，尝试原有方法
+            font_path = self._get_font_path(font_family)
+          # 如果仍然没有找到字体文件，直接使用字体名称
+          if not font_path:
+            font_path = font_family
+
+          self.logger.debug(f"字体映射: {font_family} -> {font_path}")
+
+          return self.watermark_processor.create_text_watermark(
+              text=text_content,
+              font_path=font_path,
+              font_size=font_size,
+              color=color,
+              shadow=shadow_enabled,
+              shadow_offset=(2, 2),
+              shadow_color=shadow_color,
+              stroke_width=stroke_width,
+              stroke_color=stroke_color,
+              bold=bold,
+              italic=italic
+          )
+
+        cache_key = ('text', text_content, font_family, font_size, color,
+                     shadow_enabled, stroke_width, bold, italic)
+        watermark = self._get_cached_watermark(
+            cache_key, create_text_watermark)
 
       elif watermark_config.get('type') == 'image':
         # 图片水印
@@ -573,23 +755,29 @@ class MainWindow:
         scale = image_config.get('scale', 0.25)  # 默认25%
         opacity = image_config.get('opacity', 1.0)
 
-        if image_path and os.path.exists(image_path):
+        image_mtime = self._get_file_mtime(image_path)
+        if image_mtime is not None:
           # 根据缩放比例计算水印尺寸
           max_width = int(result_image.width * scale)
           max_height = int(result_image.height * scale)
           max_size = (max_width, max_height)
 
-          watermark = self.watermark_processor.load_image_watermark(
-              image_path, size=max_size, opacity=opacity
-          )
+          cache_key = ('image', image_path, image_mtime, max_size, opacity)
+          watermark = self._get_cached_watermark(
+              cache_key,
+              lambda: self.watermark_processor.load_image_watermark(
+                  image_path, size=max_size, opacity=opacity))
 
       # 如果成功生成水印，应用到图像上
       if watermark:
         # 应用旋转（如果有）
+        # 只旋转小尺寸的水印图块，旋转结果同样按外观参数和角度缓存
         rotation = position_config.get('rotation', 0)
         if rotation != 0:
-          watermark = self.watermark_processor.rotate_watermark(
-              watermark, rotation)
+          watermark = self._get_cached_watermark(
+              cache_key + ('rotation', rotation),
+              partial(self.watermark_processor.rotate_watermark,
+                      watermark, rotation))
           self.logger.info(f"水印旋转 {rotation}°")
 
         # 计算水印位置
@@ -601,6 +789,16 @@ class MainWindow:
         watermark_bounds = (position[0], position[1],
                             watermark.width, watermark.height)
 
+        if draft_scale is not None:
+          # 只缩小小尺寸的水印图块，底图在一次拖动中复用
+          result_image = self._get_draft_base(image, draft_scale)
+          ratio = result_image.width / image.width
+          watermark = watermark.resize(
+              (max(1, round(watermark.width * ratio)),
+               max(1, round(watermark.height * ratio))),
+              Image.Resampling.BILINEAR)
+          position = (round(position[0] * ratio), round(position[1] * ratio))
+
         # 应用水印
         result_image = self.watermark_processor.apply_watermark(
             result_image, watermark, position
@@ -612,6 +810,31 @@ class MainWindow:
       self.logger.error(f"应用水印失败: {str(e)}")
       return (image, None) if return_bounds else image
 
+  def _get_cached_watermark(self, cache_key: tuple, factory):
+    """
+    获取缓存的水印图块，未命中时调用factory生成并缓存
+
+    Args:
+        cache_key: 由水印外观参数组成的缓存键
+        factory: 生成水印图像的函数
+
+    Returns:
+        水印图像，生成失败时返回None
+    """
+    # 生成过程同样在锁内进行，字体对象不支持多线程同时绘制
+    with self._watermark_cache_lock:
+      watermark = self._watermark_cache.get(cache_key)
+      if watermark is not None:
+        self._watermark_cache.move_to_end(cache_key)
+        return watermark
+
+      watermark = factory()
+      if watermark is not None:
+        self._watermark_cache[cache_key] = watermark
+        if len(self._watermark_cache) > WATERMARK_CACHE_SIZE:
+          self._watermark_cache.popitem(last=False)
+      return watermark
+
   def _calculate_watermark_position(self, image_size, watermark_size, position_config):
     """
     计算水印位置
@@ -701,15 +924,12 @@ class MainWindow:
             os.path.expanduser("~/.local/share/fonts/")
         ]
 
-      # 常见字体文件扩展名
-      font_extensions = ['*.ttf', '*.ttc', '*.otf', '*.woff', '*.woff2']
-
       # 搜索字体文件
       for font_dir in font_dirs:
         if not os.path.exists(font_dir):
           continue
 
-        for ext in font_extensions:
+        for ext in self._FONT_FILE_PATTERNS:
           # 递归搜索字体文件
           pattern = os.path.join(font_dir, "**", ext)
           for font_file in glob.glob(pattern, recursive=True):
@@ -731,26 +951,13 @@ class MainWindow:
   def _is_font_match(self, font_family: str, filename: str) -> bool:
     """检查字体文件名是否匹配字体族名"""
     try:
-      # 字体名称映射表（用于匹配常见的字体文件名）
-      font_mapping = {
-          '微软雅黑': ['msyh', 'microsoftyahei', 'yahei'],
-          '宋体': ['simsun', 'nsimsun'],
-          '黑体': ['simhei', 'hei'],
-          '仿宋': ['simfang', 'fangsong'],
-          '楷体': ['simkai', 'kai'],
-          'arial': ['arial'],
-          'times new roman': ['times', 'timesnr'],
-          'calibri': ['calibri'],
-          'helvetica': ['helvetica', 'helv'],
-          'courier new': ['courier', 'cour']
-      }
-
       font_key = font_family.lower()
       filename_lower = filename.lower()
 
       # 1. 检查映射表
-      if font_key in font_mapping:
-        return any(name in filename_lower for name in font_mapping[font_key])
+      aliases = self._FONT_FILE_ALIASES.get(font_key)
+      if aliases is not None:
+        return any(name in filename_lower for name in aliases)
 
       # 2. 直接名称匹配（包含中文）
       if font_family in filename:
@@ -927,14 +1134,7 @@ class MainWindow:
     try:
       file_paths = filedialog.askopenfilenames(
           title="选择图片文件",
-          filetypes=[
-              ("图片文件", "*.jpg *.jpeg *.png *.bmp *.tiff"),
-              ("JPEG文件", "*.jpg *.jpeg"),
-              ("PNG文件", "*.png"),
-              ("BMP文件", "*.bmp"),
-              ("TIFF文件", "*.tiff"),
-              ("所有文件", "*.*")
-          ]
+          filetypes=IMPORT_IMAGE_FILETYPES
       )
 
       if file_paths:
@@ -1112,76 +1312,96 @@ class MainWindow:
       watermark_config = self._get_current_watermark_config()
       position_config = self._get_current_position_config()
 
-      # 遍历所有文件
-      for index, file_info in enumerate(files):
-        # 检查是否取消
-        if progress_dialog.is_cancelled():
-          self.logger.info("用户取消批量导出")
-          break
-
-        try:
-          # 更新进度
-          file_name = Path(file_info['path']).name
-          progress_percentage = ((index + 1) / len(files)) * 100
-          progress_dialog.update_progress(
-              percentage=progress_percentage,
-              status=f"正在处理: {file_name} ({index + 1}/{len(files)})"
-          )
-
-          # 加载图片
-          original_image = self.image_processor.load_image(file_info['path'])
-          if not original_image:
-            failed_count += 1
-            failed_files.append(file_name)
-            continue
-
-          # 应用水印
-          watermarked_image = self._apply_watermark_to_image(
-              original_image, watermark_config, position_config
-          )
+      # 后台线程预先加载图片并应用水印，主线程按顺序编码保存，
+      # 同时最多预取 workers + 1 张，避免一次性解码全部图片
+      max_workers = min(4, os.cpu_count() or 1)
+      with ThreadPoolExecutor(max_workers=max_workers,
+                              thread_name_prefix="export") as executor:
+        prepared = deque()
+        file_iter = iter(files)
+
+        def submit_next():
+          next_file = next(file_iter, None)
+          if next_file is not None:
+            prepared.append(executor.submit(
+                self._prepare_export_image, next_file['path'],
+                watermark_config, position_config))
+
+        for _ in range(max_workers + 1):
+          submit_next()
+
+        # 遍历所有文件
+        for index, file_info in enumerate(files):
+          future = prepared.popleft()
+          submit_next()
+
+          # 检查是否取消
+          if progress_dialog.is_cancelled():
+            self.logger.info("用户取消批量导出")
+            break
+
+          try:
+            # 更新进度
+            file_name = Path(file_info['path']).name
+            progress_percentage = ((index + 1) / len(files)) * 100
+            progress_dialog.update_progress(
+                percentage=progress_percentage,
+                status=f"正在处理: {file_name} ({index + 1}/{len(files)})"
+            )
+
+            # 取得后台线程加载并加好水印的图片
+            watermarked_image = future.result()
+            if not watermarked_image:
+              failed_count += 1
+              failed_files.append(file_name)
+              continue
+
+            # 确定输出格式
+            if output_format == 'original':
+              # 使用原始文件格式
+              original_ext = Path(file_info['path']).suffix.lower()
+              # 将扩展名转换为格式代码
+              ext_to_format = {'.jpg': 'jpg', '.jpeg': 'jpg', '.png': 'png',
+                               '.bmp': 'bmp', '.tiff': 'tiff', '.tif': 'tiff'}
+              current_format = ext_to_format.get(original_ext, 'png')
+            else:
+              current_format = output_format
+
+            # 构建输出文件名
+            original_name = Path(file_info['path']).stem
+
+            if naming_mode == 'prefix':
+              output_name = f"{custom_prefix}{original_name}.{current_format}"
+            elif naming_mode == 'suffix':
+              output_name = f"{original_name}{custom_suffix}.{current_format}"
+            else:  # overwrite
+              output_name = f"{original_name}.{current_format}"
+
+            output_path = os.path.join(output_dir, output_name)
+
+            # 导出图片
+            if self.image_exporter.export_image(
+                image=watermarked_image,
+                output_path=output_path,
+                format_type=current_format,
+                quality=quality,
+                resize_config=resize_config
+            ):
+              success_count += 1
+              self.logger.info(f"成功导出: {output_name}")
+            else:
+              failed_count += 1
+              failed_files.append(file_name)
+              self.logger.error(f"导出失败: {file_name}")
 
-          # 确定输出格式
-          if output_format == 'original':
-            # 使用原始文件格式
-            original_ext = Path(file_info['path']).suffix.lower()
-            # 将扩展名转换为格式代码
-            ext_to_format = {'.jpg': 'jpg', '.jpeg': 'jpg', '.png': 'png',
-                             '.bmp': 'bmp', '.tiff': 'tiff', '.tif': 'tiff'}
-            current_format = ext_to_format.get(original_ext, 'png')
-          else:
-            current_format = output_format
-
-          # 构建输出文件名
-          original_name = Path(file_info['path']).stem
-
-          if naming_mode == 'prefix':
-            output_name = f"{custom_prefix}{original_name}.{current_format}"
-          elif naming_mode == 'suffix':
-            output_name = f"{original_name}{custom_suffix}.{current_format}"
-          else:  # overwrite
-            output_name = f"{original_name}.{current_format}"
-
-          output_path = os.path.join(output_dir, output_name)
-
-          # 导出图片
-          if self.image_exporter.export_image(
-              image=watermarked_image,
-              output_path=output_path,
-              format_type=current_format,
-              quality=quality,
-              resize_config=resize_config
-          ):
-            success_count += 1
-            self.logger.info(f"成功导出: {output_name}")
-          else:
+          except Exception as e:
             failed_count += 1
             failed_files.append(file_name)
-            self.logger.error(f"导出失败: {file_name}")
+            self.logger.error(f"处理文件失败 {file_name}: {str(e)}")
 
-        except Exception as e:
-          failed_count += 1
-          failed_files.append(file_name)
-          self.logger.error(f"处理文件失败 {file_name}: {str(e)}")
+        # 取消时丢弃尚未开始的任务
+        for future in prepared:
+          future.cancel()
 
       # 关闭进度对话框
       progress_dialog.close()
@@ -1208,6 +1428,25 @@ class MainWindow:
       self.logger.error(f"批量导出失败: {str(e)}")
       messagebox.showerror("错误", f"批量导出失败: {str(e)}")
 
+  def _prepare_export_image(self, image_path: str, watermark_config: Dict[str, Any],
+                            position_config: Dict[str, Any]):
+    """
+    加载图片并应用水印（在批量导出的工作线程中执行）
+
+    Args:
+        image_path: 图片路径
+        watermark_config: 水印配置
+        position_config: 位置配置
+
+    Returns:
+        加好水印的图片，加载失败时返回None
+    """
+    original_image = self.image_processor.load_image(image_path)
+    if not original_image:
+      return None
+    return self._apply_watermark_to_image(
+        original_image, watermark_config, position_config)
+
   def _get_current_watermark_config(self) -> Dict[str, Any]:
     """获取当前水印配置"""
     try:
@@ -1300,23 +1539,25 @@ class MainWindow:
       action, template_name, template_config = result
 
       if action == 'load' and template_config:
-        # 应用模板配置
-        if self.watermark_control_panel:
-          # 应用水印类型和文本/图片配置
-          watermark_type = template_config.get('type', 'text')
-          self.watermark_control_panel.load_config({
-              'type': watermark_type,
-              'text': template_config.get('text', {}),
-              'image': template_config.get('image', {})
-          })
-
-        # 应用位置配置
-        position_config = template_config.get('position', {})
-        if position_config and self.position_control_panel:
-          self.position_control_panel.load_config(position_config)
-
-        # 刷新预览
-        self._update_preview()
+        # 两个面板的配置变更合并为一次预览刷新
+        with self._batch_updates():
+          # 应用模板配置
+          if self.watermark_control_panel:
+            # 应用水印类型和文本/图片配置
+            watermark_type = template_config.get('type', 'text')
+            self.watermark_control_panel.load_config({
+                'type': watermark_type,
+                'text': template_config.get('text', {}),
+                'image': template_config.get('image', {})
+            })
+
+          # 应用位置配置
+          position_config = template_config.get('position', {})
+          if position_config and self.position_control_panel:
+            self.position_control_panel.load_config(position_config)
+
+          # 刷新预览
+          self._schedule_preview_update()
 
         self.logger.info(f"成功加载模板: {template_name}")
         messagebox.showinfo("成功", f"已加载模板 '{template_name}'")
@@ -1347,8 +1588,9 @@ class MainWindow:
   def _show_help(self):
     """显示使用说明"""
     try:
-      help_dialog = HelpDialog(self.root)
-      help_dialog.show()
+      if self._help_dialog is None or not self._help_dialog.is_alive():
+        self._help_dialog = HelpDialog(self.root)
+      self._help_dialog.show()
     except Exception as e:
       self.logger.error(f"显示使用说明失败: {str(e)}")
       messagebox.showerror("错误", f"无法打开使用说明: {str(e)}")
@@ -1512,9 +1754,16 @@ class MainWindow:
   def _on_window_close(self):
     """窗口关闭事件"""
     try:
+      # 取消尚未执行的预览刷新
+      if self._preview_after_id:
+        self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = None
+
       # 清理资源
       if self.image_list_panel and hasattr(self.image_list_panel, 'destroy'):
         self.image_list_panel.destroy()
+      if self.preview_panel:
+        self.preview_panel.destroy()
 
       self._save_config()
       self.root.destroy()
@@ -7,11 +7,12 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import List, Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Optional, Iterable
 from PIL import Image, ImageTk
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import queue
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 class ImageListPanel:
   """图片列表面板"""
 
+  # 可以直接缩放、无需预先转换模式的图像模式
+  _THUMBNAIL_RESIZE_MODES = ('RGB', 'RGBA', 'L', 'LA', 'CMYK')
+
   def __init__(self, parent: tk.Widget,
                on_selection_change: Optional[Callable[[int], None]] = None,
                on_remove_image: Optional[Callable[[int], None]] = None,
@@ -44,13 +48,20 @@ class ImageListPanel:
 
     # 缩略图缓存
     self.thumbnail_cache = {}
+    # 按像素内容摘要共享PhotoImage，内容相同的缩略图只保留一份
+    self._photo_by_digest = {}
     self.thumbnail_size = (50, 50)
     self.loading_image = None
     self.error_image = None
 
-    # 线程池用于异步加载缩略图
-    self.thumbnail_executor = ThreadPoolExecutor(
-        max_workers=2, thread_name_prefix="thumbnail")
+    # 常驻工作线程和任务队列用于异步加载缩略图
+    self._thumbnail_queue = queue.Queue()
+    self._thumbnail_workers = []
+    for i in range(2):
+      worker = threading.Thread(target=self._thumbnail_worker,
+                                name=f"thumbnail_{i}", daemon=True)
+      worker.start()
+      self._thumbnail_workers.append(worker)
 
     # 创建界面
     self._create_widgets()
@@ -131,16 +142,18 @@ class ImageListPanel:
   def _create_placeholder_images(self):
     """创建占位图像"""
     try:
+      # 纯色占位图直接用Tk原生PhotoImage填充，无需经过PIL
+      width, height = self.thumbnail_size
+
       # 创建加载中图像
-      canvas_width = self.thumbnail_size[0]
-      loading_img = Image.new(
-          'RGB', (canvas_width, self.thumbnail_size[1]), '#E0E0E0')
-      self.loading_image = ImageTk.PhotoImage(loading_img)
+      self.loading_image = tk.PhotoImage(
+          master=self.parent, width=width, height=height)
+      self.loading_image.put("#E0E0E0", to=(0, 0, width, height))
 
       # 创建错误图像
-      error_img = Image.new(
-          'RGB', (canvas_width, self.thumbnail_size[1]), '#FFE0E0')
-      self.error_image = ImageTk.PhotoImage(error_img)
+      self.error_image = tk.PhotoImage(
+          master=self.parent, width=width, height=height)
+      self.error_image.put("#FFE0E0", to=(0, 0, width, height))
 
     except Exception as e:
       self.logger.error(f"创建占位图像失败: {str(e)}")
@@ -153,53 +166,76 @@ class ImageListPanel:
         image_path: 图像文件路径
         item_id: TreeView项目ID
     """
-    def load_thumbnail():
+    # 放入任务队列，由常驻工作线程处理
+    self._thumbnail_queue.put((image_path, item_id))
+
+  def _thumbnail_worker(self):
+    """缩略图工作线程，持续从队列取任务直到收到结束标记"""
+    while True:
+      task = self._thumbnail_queue.get()
+      if task is None:
+        break
       try:
-        if image_path in self.thumbnail_cache:
-          cached_photo = self.thumbnail_cache[image_path]
-          self.parent.after(0, lambda p=cached_photo,
-                            iid=item_id: self._update_thumbnail(iid, p))
-          return
-
-        # 加载和缩放图像
-        with Image.open(image_path) as img:
-          # 转换为RGB模式以确保兼容性
-          if img.mode != 'RGB':
-            img = img.convert('RGB')
-
-          # 生成缩略图
-          img.thumbnail(self.thumbnail_size, Image.Resampling.LANCZOS)
-
-          # 创建更宽的背景，右侧添加额外空间，使用透明背景
-          canvas_width = self.thumbnail_size[0] + 24  # 右侧增加20像素空白
-          thumb_img = Image.new(
-              'RGBA', (canvas_width, self.thumbnail_size[1]), (0, 0, 0, 0))  # 透明背景
-
-          # 将原图转换为RGBA以支持透明
-          if img.mode != 'RGBA':
-            img = img.convert('RGBA')
-
-          # 将缩略图放在左侧，让其自然居中
-          x_offset = (self.thumbnail_size[0] - img.size[0]) // 2
-          y_offset = (self.thumbnail_size[1] - img.size[1]) // 2
-          thumb_img.paste(img, (x_offset, y_offset), img)
-
-          # 转换为Tkinter图像
-          photo = ImageTk.PhotoImage(thumb_img)
-          self.thumbnail_cache[image_path] = photo
-
-          # 在主线程中更新UI
-          self.parent.after(0, lambda p=photo,
-                            iid=item_id: self._update_thumbnail(iid, p))
-
+        self._load_thumbnail(*task)
       except Exception as e:
-        self.logger.error(f"生成缩略图失败 {image_path}: {str(e)}")
-        # 在主线程中设置错误图像
-        self.parent.after(
-            0, lambda iid=item_id: self._update_thumbnail(iid, self.error_image))
+        # 例如Tk正在关闭时after调用失败；记录后继续处理后续任务，避免线程退出
+        self.logger.error(f"处理缩略图任务失败 {task[0]}: {str(e)}")
+
+  def _load_thumbnail(self, image_path: str, item_id: str):
+    """
+    加载并生成单个缩略图（在工作线程中执行）
+
+    Args:
+        image_path: 图像文件路径
+        item_id: TreeView项目ID
+    """
+    try:
+      if image_path in self.thumbnail_cache:
+        cached_photo = self.thumbnail_cache[image_path]
+        self.parent.after(0, self._update_thumbnail, item_id, cached_photo)
+        return
+
+      # 加载和缩放图像
+      with Image.open(image_path) as img:
+        # 调色板、16位等模式无法直接插值缩放，需先转换
+        if img.mode not in self._THUMBNAIL_RESIZE_MODES:
+          img = img.convert('RGB')
+
+        # 生成缩略图（50像素的列表图标用双线性插值已足够清晰）
+        # 在原始模式下先缩小再转换，模式转换只作用于缩略图尺寸
+        img.thumbnail(self.thumbnail_size, Image.Resampling.BILINEAR)
+
+        # 转换为RGB模式以确保兼容性，再转为RGBA以支持透明
+        if img.mode != 'RGB':
+          img = img.convert('RGB')
+        img = img.convert('RGBA')
+
+        # 直接以越界裁剪完成居中和留白：超出原图的区域自动填充为透明，
+        # 右侧额外留出空间，省去新建背景图再粘贴的一次分配和拷贝
+        canvas_width = self.thumbnail_size[0] + 24  # 右侧增加20像素空白
+        x_offset = (self.thumbnail_size[0] - img.size[0]) // 2
+        y_offset = (self.thumbnail_size[1] - img.size[1]) // 2
+        thumb_img = img.crop((-x_offset, -y_offset,
+                              canvas_width - x_offset,
+                              self.thumbnail_size[1] - y_offset))
+
+      # 退出with块后源图已释放，再转换为Tkinter图像以降低峰值内存
+      # （内容相同则复用已有的PhotoImage）
+      digest = hashlib.blake2b(thumb_img.tobytes(), digest_size=8).digest()
+      photo = self._photo_by_digest.get(digest)
+      if photo is None:
+        photo = ImageTk.PhotoImage(thumb_img)
+        self._photo_by_digest[digest] = photo
+      del thumb_img
+      self.thumbnail_cache[image_path] = photo
+
+      # 在主线程中更新UI
+      self.parent.after(0, self._update_thumbnail, item_id, photo)
 
-    # 提交到线程池
-    self.thumbnail_executor.submit(load_thumbnail)
+    except Exception as e:
+      self.logger.error(f"生成缩略图失败 {image_path}: {str(e)}")
+      # 在主线程中设置错误图像
+      self.parent.after(0, self._update_thumbnail, item_id, self.error_image)
 
   def _update_thumbnail(self, item_id: str, photo):
     """
@@ -215,86 +251,97 @@ class ImageListPanel:
     except Exception as e:
       self.logger.error(f"更新缩略图失败: {str(e)}")
 
-  def refresh_list(self, image_list: List[Dict[str, Any]]):
+  def refresh_list(self, image_list: Iterable[Dict[str, Any]]):
     """
     刷新图片列表
 
     Args:
-        image_list: 图片信息列表
+        image_list: 图片信息列表（可以是任意可迭代对象，只遍历一次）
     """
     try:
-      # 清空现有项目
-      for item in self.tree.get_children():
-        self.tree.delete(item)
+      # 一次性清空现有项目
+      self.tree.delete(*self.tree.get_children())
 
-      self.image_list = image_list
+      self.image_list = []
 
-      # 添加新项目
+      # 添加新项目，边遍历边插入
       for i, image_info in enumerate(image_list):
-        name = image_info.get('name', 'Unknown')
-        size = self._format_file_size(image_info.get('size', 0))
-        format_ext = image_info.get('extension', '').upper()
-        status = image_info.get('status', '就绪')
+        values = self._build_row_values(image_info)
         image_path = image_info.get('path')
 
-        # 检查缓存中是否已有缩略图
-        initial_image = self.loading_image
-        if image_path in self.thumbnail_cache:
-          initial_image = self.thumbnail_cache[image_path]
+        # 检查缓存中是否已有缩略图，命中时直接使用，无需再走工作线程
+        cached_photo = self.thumbnail_cache.get(image_path)
 
         # 插入项目
         item_id = self.tree.insert('', tk.END,
                                    text='',
-                                   image=initial_image,
-                                   values=(name, size, format_ext, status),
+                                   image=cached_photo or self.loading_image,
+                                   values=values,
                                    tags=(str(i),))
 
         # 异步加载真实缩略图（如果需要）
-        if image_path and os.path.exists(image_path):
+        if cached_photo is None and image_path and os.path.exists(image_path):
           self._generate_thumbnail(image_path, item_id)
 
-      self.logger.info(f"刷新图片列表完成，共 {len(image_list)} 个文件")
+        self.image_list.append(image_info)
+
+      self.logger.info(f"刷新图片列表完成，共 {len(self.image_list)} 个文件")
       self._update_status_label()
 
     except Exception as e:
       self.logger.error(f"刷新图片列表失败: {str(e)}")
 
-  def add_images(self, image_list: List[Dict[str, Any]]):
+  def add_images(self, image_list: Iterable[Dict[str, Any]]):
     """
     添加图片到列表
 
     Args:
-        image_list: 要添加的图片信息列表
+        image_list: 要添加的图片信息列表（可以是任意可迭代对象，只遍历一次）
     """
     try:
       start_index = len(self.image_list)
 
       for i, image_info in enumerate(image_list):
-        name = image_info.get('name', 'Unknown')
-        size = self._format_file_size(image_info.get('size', 0))
-        format_ext = image_info.get('extension', '').upper()
-        status = image_info.get('status', '就绪')
+        values = self._build_row_values(image_info)
+        image_path = image_info.get('path')
+        cached_photo = self.thumbnail_cache.get(image_path)
 
-        # 插入项目，使用加载中图像作为初始缩略图
+        # 插入项目，未缓存时使用加载中图像作为初始缩略图
         item_id = self.tree.insert('', tk.END,
                                    text='',
-                                   image=self.loading_image,
-                                   values=(name, size, format_ext, status),
+                                   image=cached_photo or self.loading_image,
+                                   values=values,
                                    tags=(str(start_index + i),))
 
         # 异步加载真实缩略图
-        image_path = image_info.get('path')
-        if image_path and os.path.exists(image_path):
+        if cached_photo is None and image_path and os.path.exists(image_path):
           self._generate_thumbnail(image_path, item_id)
 
         self.image_list.append(image_info)
 
-      self.logger.info(f"添加 {len(image_list)} 个图片到列表")
+      self.logger.info(
+          f"添加 {len(self.image_list) - start_index} 个图片到列表")
       self._update_status_label()
 
     except Exception as e:
       self.logger.error(f"添加图片到列表失败: {str(e)}")
 
+  def _build_row_values(self, image_info: Dict[str, Any]) -> tuple:
+    """
+    生成列表行的显示值
+
+    Args:
+        image_info: 图片信息
+
+    Returns:
+        (文件名, 大小, 格式, 状态)
+    """
+    get = image_info.get
+    return (get('name', 'Unknown'),
+            self._format_file_size(get('size', 0)),
+            get('extension', '').upper(),
+            get('status', '就绪'))
+
   def get_selected_index(self) -> int:
     """
     获取当前选中的索引
@@ -371,8 +418,7 @@ class ImageListPanel:
         self.on_clear_list()
       else:
         # 如果没有回调，执行本地清空（向后兼容）
-        for item in self.tree.get_children():
-          self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         self.image_list.clear()
         self.selected_index = -1
         if self.on_selection_change:
@@ -396,14 +442,10 @@ class ImageListPanel:
         # 更新数据
         self.image_list[index]['status'] = status
 
-        # 更新TreeView显示
+        # 更新TreeView显示（只写状态列）
         items = self.tree.get_children()
         if index < len(items):
-          item_id = items[index]
-          current_values = list(self.tree.item(item_id)['values'])
-          if len(current_values) >= 4:
-            current_values[3] = status  # 状态列（现在是第4列，索引3）
-            self.tree.item(item_id, values=current_values)
+          self.tree.set(items[index], 'status', status)
 
     except Exception as e:
       self.logger.error(f"更新图像状态失败: {str(e)}")
@@ -440,11 +482,13 @@ class ImageListPanel:
   def destroy(self):
     """清理资源"""
     try:
-      # 关闭线程池
-      self.thumbnail_executor.shutdown(wait=False)
+      # 通知工作线程退出
+      for _ in self._thumbnail_workers:
+        self._thumbnail_queue.put(None)
 
       # 清理缓存
       self.thumbnail_cache.clear()
+      self._photo_by_digest.clear()
 
     except Exception as e:
       self.logger.error(f"清理资源失败: {str(e)}")
@@ -460,15 +504,12 @@ class ImageListPanel:
         格式化的大小字符串
     """
     try:
-      if size_bytes == 0:
+      size_bytes = int(size_bytes)
+      if size_bytes <= 0:
         return "0 B"
 
-      size_names = ["B", "KB", "MB", "GB"]
-      i = 0
-      while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-
-      return f"{size_bytes:.1f} {size_names[i]}"
+      # 单位下标由二进制位数直接得出，每10位对应一级1024
+      i = min((size_bytes.bit_length() - 1) // 10, 3)
+      return f"{size_bytes / (1 << (10 * i)):.1f} {('B', 'KB', 'MB', 'GB')[i]}"
     except Exception:
       return "Unknown"
@@ -7,6 +7,7 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
+from functools import partial
 from typing import Optional, Callable, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,44 @@ logger = logging.getLogger(__name__)
 class PositionControlPanel:
   """位置控制面板"""
 
+  # 预设位置坐标计算表，参数为 (图宽, 图高, 水印宽, 水印高, 水平边距, 垂直边距)
+  _POS_FUNCS = {
+      "top_left": lambda iw, ih, ww, wh, hm, vm: (hm, vm),
+      "top_center": lambda iw, ih, ww, wh, hm, vm: ((iw - ww) // 2, vm),
+      "top_right": lambda iw, ih, ww, wh, hm, vm: (iw - ww - hm, vm),
+      "middle_left": lambda iw, ih, ww, wh, hm, vm: (hm, (ih - wh) // 2),
+      "center": lambda iw, ih, ww, wh, hm, vm: ((iw - ww) // 2, (ih - wh) // 2),
+      "middle_right": lambda iw, ih, ww, wh, hm, vm: (iw - ww - hm, (ih - wh) // 2),
+      "bottom_left": lambda iw, ih, ww, wh, hm, vm: (hm, ih - wh - vm),
+      "bottom_center": lambda iw, ih, ww, wh, hm, vm: ((iw - ww) // 2, ih - wh - vm),
+      "bottom_right": lambda iw, ih, ww, wh, hm, vm: (iw - ww - hm, ih - wh - vm)
+  }
+
+  # 九宫格按钮：(位置ID, 显示文本, 行, 列)
+  _GRID_POSITIONS = (
+      ("top_left", "左上", 0, 0),
+      ("top_center", "上中", 0, 1),
+      ("top_right", "右上", 0, 2),
+      ("middle_left", "左中", 1, 0),
+      ("center", "中心", 1, 1),
+      ("middle_right", "右中", 1, 2),
+      ("bottom_left", "左下", 2, 0),
+      ("bottom_center", "下中", 2, 1),
+      ("bottom_right", "右下", 2, 2),
+  )
+
+  # 九宫格画布中每个格子的尺寸和间距（像素）及配色
+  _CELL_WIDTH = 72
+  _CELL_HEIGHT = 32
+  _CELL_GAP = 4
+  _CELL_FILL = "#f0f0f0"
+  _CELL_OUTLINE = "#a0a0a0"
+  _SELECTED_FILL = "#cce4f7"
+  _SELECTED_OUTLINE = "#0078d7"
+
+  # 旋转滑块范围内各角度的标签文本，拖动时直接查表
+  _ROTATION_TEXTS = {angle: f"{angle}°" for angle in range(-180, 181)}
+
   def __init__(self, parent: tk.Widget,
                on_position_change: Optional[Callable[[], None]] = None,
                config_manager=None):
@@ -31,12 +70,42 @@ class PositionControlPanel:
     self.config_manager = config_manager
     self.logger = logging.getLogger(__name__)
 
-    # 位置按钮
-    self.position_buttons = {}
+    # 默认位置配置（仅在提供配置管理器时使用）
+    self._defaults_position = None
+    if config_manager:
+      from ...core.config_manager import ConfigManager
+      self._defaults_position = ConfigManager.DEFAULT_CONFIG['watermark']['position']
+
+    # 缓存的位置、边距、旋转和自定义坐标，避免每次预览都读取Tcl变量
+    self._position_cached = "bottom_right"
+    self._h_margin_cached = 20
+    self._v_margin_cached = 20
+    self._rotation_cached = 0
+    self._custom_x_cached = 20
+    self._custom_y_cached = 20
+    # 旋转角度标签当前显示的角度，未变化时不重设文本
+    self._rotation_label_angle = 0
+    # 是否正在拖动旋转滑块（拖动期间主窗口以低分辨率渲染预览）
+    self._dragging = False
+
+    # 变更通知的防抖定时器
+    self._notify_after_id = None
+    # 批量载入配置期间暂停变更通知
+    self._suspend_notify = False
 
     # 创建界面
     self._create_widgets()
 
+    # 变量写入时同步缓存
+    self._bind_cached(self.selected_position, '_position_cached')
+    self._bind_cached(self.h_margin, '_h_margin_cached')
+    self._bind_cached(self.v_margin, '_v_margin_cached')
+    self._bind_cached(self.rotation, '_rotation_cached')
+    self._bind_cached(self.custom_x, '_custom_x_cached')
+    self._bind_cached(self.custom_y, '_custom_y_cached')
+    # 位置变量被程序修改（载入配置、拖拽水印）时同步九宫格高亮
+    self.selected_position.trace_add('write', self._on_position_var_write)
+
   def _create_widgets(self):
     """创建界面组件"""
     try:
@@ -48,73 +117,42 @@ class PositionControlPanel:
       position_frame = ttk.LabelFrame(main_frame, text="水印位置")
       position_frame.pack(fill=tk.X, pady=5)
 
-      # 九宫格位置
-      grid_frame = ttk.Frame(position_frame)
-      grid_frame.pack(pady=10)
-
       # 当前选中位置
       self.selected_position = tk.StringVar(value="bottom_right")
 
-      # 创建九宫格按钮
-      positions = [
-          ("top_left", "左上", 0, 0),
-          ("top_center", "上中", 0, 1),
-          ("top_right", "右上", 0, 2),
-          ("middle_left", "左中", 1, 0),
-          ("center", "中心", 1, 1),
-          ("middle_right", "右中", 1, 2),
-          ("bottom_left", "左下", 2, 0),
-          ("bottom_center", "下中", 2, 1),
-          ("bottom_right", "右下", 2, 2)
-      ]
-
-      for pos_id, text, row, col in positions:
-        btn = tk.Radiobutton(
-            grid_frame,
-            text=text,
-            variable=self.selected_position,
-            value=pos_id,
-            command=self._on_position_change,
-            indicatoron=False,
-            width=8,
-            height=2
-        )
-        btn.grid(row=row, column=col, padx=2, pady=2, sticky="nsew")
-        self.position_buttons[pos_id] = btn
+      # 九宫格位置（在一个画布上绘制9个格子，代替9个单选按钮控件）
+      self._create_position_grid(position_frame)
 
       # 添加自定义位置选项
-      custom_btn = tk.Radiobutton(
+      tk.Radiobutton(
           position_frame,
           text="自定义位置",
           variable=self.selected_position,
           value="custom",
           command=self._on_position_change,
           indicatoron=False
-      )
-      custom_btn.pack(pady=5)
-      self.position_buttons["custom"] = custom_btn
+      ).pack(pady=5)
 
-      # 自定义坐标输入
+      # 自定义坐标输入（标签和输入框直接用grid排列，不再为每行单独建Frame）
       custom_coord_frame = ttk.LabelFrame(position_frame, text="自定义坐标 (像素)")
       custom_coord_frame.pack(fill=tk.X, pady=5)
+      custom_coord_frame.columnconfigure(1, weight=1)
 
       # X 坐标
-      x_frame = ttk.Frame(custom_coord_frame)
-      x_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(x_frame, text="X:").pack(side=tk.LEFT)
+      ttk.Label(custom_coord_frame, text="X:").grid(
+          row=0, column=0, sticky="w", pady=2)
       self.custom_x = tk.IntVar(value=20)
-      x_spinbox = ttk.Spinbox(x_frame, from_=0, to=10000, width=10,
+      x_spinbox = ttk.Spinbox(custom_coord_frame, from_=0, to=10000, width=10,
                               textvariable=self.custom_x, command=self._on_setting_change)
-      x_spinbox.pack(side=tk.RIGHT)
+      x_spinbox.grid(row=0, column=1, sticky="e", pady=2)
 
       # Y 坐标
-      y_frame = ttk.Frame(custom_coord_frame)
-      y_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(y_frame, text="Y:").pack(side=tk.LEFT)
+      ttk.Label(custom_coord_frame, text="Y:").grid(
+          row=1, column=0, sticky="w", pady=2)
       self.custom_y = tk.IntVar(value=20)
-      y_spinbox = ttk.Spinbox(y_frame, from_=0, to=10000, width=10,
+      y_spinbox = ttk.Spinbox(custom_coord_frame, from_=0, to=10000, width=10,
                               textvariable=self.custom_y, command=self._on_setting_change)
-      y_spinbox.pack(side=tk.RIGHT)
+      y_spinbox.grid(row=1, column=1, sticky="e", pady=2)
 
       # 重置位置按钮（放在位置选择框内）
       ttk.Button(position_frame, text="重置位置",
@@ -123,28 +161,27 @@ class PositionControlPanel:
       # 边距设置
       margin_frame = ttk.LabelFrame(main_frame, text="边距设置")
       margin_frame.pack(fill=tk.X, pady=5)
+      margin_frame.columnconfigure(1, weight=1)
 
       # 水平边距
-      h_margin_frame = ttk.Frame(margin_frame)
-      h_margin_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(h_margin_frame, text="水平边距:").pack(side=tk.LEFT)
+      ttk.Label(margin_frame, text="水平边距:").grid(
+          row=0, column=0, sticky="w", pady=2)
       self.h_margin = tk.IntVar(value=20)
-      h_spinbox = ttk.Spinbox(h_margin_frame, from_=0, to=200, width=10,
+      h_spinbox = ttk.Spinbox(margin_frame, from_=0, to=200, width=10,
                               textvariable=self.h_margin, command=self._on_setting_change)
-      h_spinbox.pack(side=tk.RIGHT)
+      h_spinbox.grid(row=0, column=1, sticky="e", pady=2)
 
       # 垂直边距
-      v_margin_frame = ttk.Frame(margin_frame)
-      v_margin_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(v_margin_frame, text="垂直边距:").pack(side=tk.LEFT)
+      ttk.Label(margin_frame, text="垂直边距:").grid(
+          row=1, column=0, sticky="w", pady=2)
       self.v_margin = tk.IntVar(value=20)
-      v_spinbox = ttk.Spinbox(v_margin_frame, from_=0, to=200, width=10,
+      v_spinbox = ttk.Spinbox(margin_frame, from_=0, to=200, width=10,
                               textvariable=self.v_margin, command=self._on_setting_change)
-      v_spinbox.pack(side=tk.RIGHT)
+      v_spinbox.grid(row=1, column=1, sticky="e", pady=2)
 
       # 重置边距按钮（放在边距设置框内）
       ttk.Button(margin_frame, text="重置边距",
-                 command=self._reset_margins).pack(pady=5)
+                 command=self._reset_margins).grid(row=2, column=0, columnspan=2, pady=5)
 
       # 旋转设置
       rotation_frame = ttk.LabelFrame(main_frame, text="旋转设置")
@@ -157,6 +194,8 @@ class PositionControlPanel:
       rot_scale = ttk.Scale(rot_frame, from_=-180, to=180, orient=tk.HORIZONTAL,
                             variable=self.rotation, command=self._on_setting_change)
       rot_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
+      rot_scale.bind('<ButtonPress-1>', self._on_drag_start, add='+')
+      rot_scale.bind('<ButtonRelease-1>', self._on_drag_end, add='+')
 
       # 显示角度值
       self.rotation_label = ttk.Label(rotation_frame, text="0°")
@@ -169,6 +208,142 @@ class PositionControlPanel:
     except Exception as e:
       self.logger.error(f"加载位置配置失败: {str(e)}")
 
+  def _create_position_grid(self, parent: tk.Widget):
+    """
+    创建九宫格位置选择画布
+
+    Args:
+        parent: 父容器
+    """
+    step_x = self._CELL_WIDTH + self._CELL_GAP
+    step_y = self._CELL_HEIGHT + self._CELL_GAP
+    # 画布可获得键盘焦点（Tab切换），获得焦点时显示焦点框
+    self._pos_canvas = tk.Canvas(parent, width=step_x * 3 + self._CELL_GAP,
+                                 height=step_y * 3 + self._CELL_GAP,
+                                 highlightthickness=1, takefocus=1)
+    self._pos_canvas.pack(pady=10)
+
+    # 位置ID -> 格子矩形的画布项ID；(行, 列) -> 位置ID，供方向键移动使用
+    self._pos_rect_ids: Dict[str, int] = {}
+    self._pos_by_cell: Dict[Tuple[int, int], str] = {}
+    for pos_id, text, row, col in self._GRID_POSITIONS:
+      self._pos_by_cell[(row, col)] = pos_id
+      x = self._CELL_GAP + col * step_x
+      y = self._CELL_GAP + row * step_y
+      # 矩形和文字都带上位置ID标签，点击任一项都能找到对应位置
+      self._pos_rect_ids[pos_id] = self._pos_canvas.create_rectangle(
+          x, y, x + self._CELL_WIDTH, y + self._CELL_HEIGHT,
+          fill=self._CELL_FILL, outline=self._CELL_OUTLINE, tags=(pos_id,))
+      self._pos_canvas.create_text(
+          x + self._CELL_WIDTH // 2, y + self._CELL_HEIGHT // 2,
+          text=text, tags=(pos_id,))
+
+    # 键盘焦点所在的格子，以虚线框标出，按空格或回车选中
+    self._focus_cell = (2, 2)
+    self._focus_rect = self._pos_canvas.create_rectangle(
+        0, 0, 0, 0, outline=self._SELECTED_OUTLINE, dash=(2, 2),
+        state=tk.HIDDEN)
+
+    self._highlighted_position: Optional[str] = None
+    self._highlight_position(self.selected_position.get())
+    self._pos_canvas.bind('<Button-1>', self._on_grid_click)
+    self._pos_canvas.bind('<FocusIn>', self._on_grid_focus_in)
+    self._pos_canvas.bind('<FocusOut>', self._on_grid_focus_out)
+    for key, d_row, d_col in (('<Up>', -1, 0), ('<Down>', 1, 0),
+                              ('<Left>', 0, -1), ('<Right>', 0, 1)):
+      self._pos_canvas.bind(key, partial(self._move_grid_focus, d_row, d_col))
+    self._pos_canvas.bind('<space>', self._on_grid_select_key)
+    self._pos_canvas.bind('<Return>', self._on_grid_select_key)
+
+  def _cell_for_position(self, position: str) -> Optional[Tuple[int, int]]:
+    """获取位置ID所在的(行, 列)，自定义位置返回None"""
+    for cell, pos_id in self._pos_by_cell.items():
+      if pos_id == position:
+        return cell
+    return None
+
+  def _show_grid_focus(self, cell: Tuple[int, int]):
+    """
+    把焦点框移到指定格子
+
+    Args:
+        cell: (行, 列)
+    """
+    self._focus_cell = cell
+    row, col = cell
+    x = self._CELL_GAP + col * (self._CELL_WIDTH + self._CELL_GAP)
+    y = self._CELL_GAP + row * (self._CELL_HEIGHT + self._CELL_GAP)
+    self._pos_canvas.coords(self._focus_rect, x - 2, y - 2,
+                            x + self._CELL_WIDTH + 2, y + self._CELL_HEIGHT + 2)
+    self._pos_canvas.itemconfig(self._focus_rect, state=tk.NORMAL)
+
+  def _on_grid_focus_in(self, event=None):
+    """九宫格获得焦点时从当前选中的格子开始"""
+    cell = self._cell_for_position(self.selected_position.get())
+    self._show_grid_focus(cell or self._focus_cell)
+
+  def _on_grid_focus_out(self, event=None):
+    """九宫格失去焦点时隐藏焦点框"""
+    self._pos_canvas.itemconfig(self._focus_rect, state=tk.HIDDEN)
+
+  def _move_grid_focus(self, d_row: int, d_col: int, event=None):
+    """方向键在九宫格内移动焦点框"""
+    row = min(2, max(0, self._focus_cell[0] + d_row))
+    col = min(2, max(0, self._focus_cell[1] + d_col))
+    self._show_grid_focus((row, col))
+    return "break"
+
+  def _on_grid_select_key(self, event=None):
+    """空格或回车选中焦点框所在的格子"""
+    self._select_grid_position(self._pos_by_cell[self._focus_cell])
+    return "break"
+
+  def _select_grid_position(self, position: str):
+    """
+    选中九宫格中的位置，位置变化时通知
+
+    Args:
+        position: 位置ID
+    """
+    if position != self.selected_position.get():
+      self.selected_position.set(position)
+      self._on_position_change()
+
+  def _highlight_position(self, position: str):
+    """
+    高亮九宫格中选中的格子，只重绘新旧两个格子
+
+    Args:
+        position: 位置ID，自定义位置时不高亮任何格子
+    """
+    if position == self._highlighted_position:
+      return
+    previous = self._pos_rect_ids.get(self._highlighted_position)
+    if previous:
+      self._pos_canvas.itemconfig(previous, fill=self._CELL_FILL,
+                                  outline=self._CELL_OUTLINE, width=1)
+    current = self._pos_rect_ids.get(position)
+    if current:
+      self._pos_canvas.itemconfig(current, fill=self._SELECTED_FILL,
+                                  outline=self._SELECTED_OUTLINE, width=2)
+    self._highlighted_position = position
+
+  def _on_grid_click(self, event):
+    """九宫格点击"""
+    try:
+      self._pos_canvas.focus_set()
+      for tag in self._pos_canvas.gettags('current'):
+        if tag in self._pos_rect_ids:
+          self._show_grid_focus(self._cell_for_position(tag))
+          self._select_grid_position(tag)
+          break
+    except Exception as e:
+      self.logger.error(f"处理九宫格点击失败: {str(e)}")
+
+  def _on_position_var_write(self, *args):
+    """位置变量写入时同步九宫格高亮"""
+    self._highlight_position(self.selected_position.get())
+
   def set_custom_position(self, x: int, y: int):
     """
     设置自定义位置
@@ -188,7 +363,7 @@ class PositionControlPanel:
   def _on_position_change(self):
     """位置改变"""
     try:
-      self._notify_change()
+      self._notify_change(delay=0)
     except Exception as e:
       self.logger.error(f"处理位置改变失败: {str(e)}")
 
@@ -196,8 +371,7 @@ class PositionControlPanel:
     """设置改变"""
     try:
       # 更新旋转角度显示
-      angle = self.rotation.get()
-      self.rotation_label.config(text=f"{angle}°")
+      self._update_rotation_label(self._rotation_cached)
 
       self._notify_change()
     except Exception as e:
@@ -206,10 +380,8 @@ class PositionControlPanel:
   def _reset_position(self):
     """重置位置"""
     try:
-      if self.config_manager:
-        from ...core.config_manager import ConfigManager
-        default_position = ConfigManager.DEFAULT_CONFIG['watermark']['position']['preset']
-        self.selected_position.set(default_position)
+      if self._defaults_position:
+        self.selected_position.set(self._defaults_position['preset'])
       else:
         self.selected_position.set("bottom_right")
 
@@ -217,58 +389,111 @@ class PositionControlPanel:
       self.custom_x.set(20)
       self.custom_y.set(20)
 
-      self._notify_change()
+      self._notify_change(delay=0)
     except Exception as e:
       self.logger.error(f"重置位置失败: {str(e)}")
 
   def _reset_margins(self):
     """重置边距"""
     try:
-      if self.config_manager:
-        from ...core.config_manager import ConfigManager
-        default_margins = ConfigManager.DEFAULT_CONFIG['watermark']['position']['margins']
+      if self._defaults_position:
+        default_margins = self._defaults_position['margins']
         self.h_margin.set(default_margins.get('horizontal', 20))
         self.v_margin.set(default_margins.get('vertical', 20))
       else:
         self.h_margin.set(20)
         self.v_margin.set(20)
-      self._notify_change()
+      self._notify_change(delay=0)
     except Exception as e:
       self.logger.error(f"重置边距失败: {str(e)}")
 
   def _reset_rotation(self):
     """重置旋转"""
     try:
-      if self.config_manager:
-        from ...core.config_manager import ConfigManager
-        default_rotation = int(
-            ConfigManager.DEFAULT_CONFIG['watermark']['position']['rotation'])
+      if self._defaults_position:
+        default_rotation = int(self._defaults_position['rotation'])
         self.rotation.set(default_rotation)
-        self.rotation_label.config(text=f"{default_rotation}°")
+        self._update_rotation_label(default_rotation)
       else:
         self.rotation.set(0)
-        self.rotation_label.config(text="0°")
-      self._notify_change()
+        self._update_rotation_label(0)
+      self._notify_change(delay=0)
     except Exception as e:
       self.logger.error(f"重置旋转失败: {str(e)}")
 
-  def _notify_change(self):
-    """通知改变"""
+  def _update_rotation_label(self, angle: int):
+    """角度变化时才更新旋转角度标签（拖动滑块时同一整数角度会写入多次）"""
+    if angle == self._rotation_label_angle:
+      return
+    self._rotation_label_angle = angle
+    text = self._ROTATION_TEXTS.get(angle) or f"{angle}°"
+    self.rotation_label.config(text=text)
+
+  def _bind_cached(self, var: tk.Variable, attr: str):
+    """
+    变量写入时把值同步到对应的Python属性
+
+    Args:
+        var: Tk变量
+        attr: 缓存属性名
+    """
+    def sync(*args):
+      try:
+        setattr(self, attr, var.get())
+      except (tk.TclError, ValueError):
+        # 输入框中暂时为非法值时保留上一次的缓存
+        pass
+
+    var.trace_add('write', sync)
+    sync()
+
+  def _notify_change(self, delay: int = 50):
+    """通知改变（默认50ms防抖，拖动滑块时合并为一次通知；按钮操作传0立即通知）"""
+    if self._suspend_notify:
+      return
+    if self._notify_after_id:
+      self.parent.after_cancel(self._notify_after_id)
+    self._notify_after_id = self.parent.after(delay, self._fire_change)
+
+  def _flush_notify(self):
+    """立即触发尚在防抖等待中的变更通知"""
+    if self._notify_after_id:
+      self.parent.after_cancel(self._notify_after_id)
+      self._fire_change()
+
+  def _fire_change(self):
+    """触发位置改变回调"""
+    self._notify_after_id = None
     if self.on_position_change:
       self.on_position_change()
 
+  def _on_drag_start(self, event=None):
+    """开始拖动旋转滑块"""
+    self._dragging = True
+
+  def _on_drag_end(self, event=None):
+    """结束拖动旋转滑块，立即通知以按原图分辨率重新渲染预览"""
+    self._dragging = False
+    if self._notify_after_id:
+      self.parent.after_cancel(self._notify_after_id)
+    self._fire_change()
+
+  def is_dragging(self) -> bool:
+    """是否正在拖动旋转滑块"""
+    return self._dragging
+
   def get_config(self) -> Dict[str, Any]:
     """获取当前配置"""
     try:
       return {
-          'position': self.selected_position.get(),
+          'position': self._position_cached,
           'margins': {
-              'horizontal': self.h_margin.get(),
-              'vertical': self.v_margin.get()
+              'horizontal': self._h_margin_cached,
+              'vertical': self._v_margin_cached
           },
-          'rotation': self.rotation.get(),
-          'custom_x': self.custom_x.get(),
-          'custom_y': self.custom_y.get()
+          'rotation': self._rotation_cached,
+          'custom_x': self._custom_x_cached,
+          'custom_y': self._custom_y_cached
       }
     except Exception as e:
       self.logger.error(f"获取位置配置失败: {str(e)}")
@@ -277,25 +502,33 @@ class PositionControlPanel:
   def load_config(self, config: Dict[str, Any]):
     """载入配置"""
     try:
-      if 'position' in config:
-        self.selected_position.set(config['position'])
-
-      if 'margins' in config:
-        margins = config['margins']
-        if isinstance(margins, dict):
-          self.h_margin.set(margins.get('horizontal', 20))
-          self.v_margin.set(margins.get('vertical', 20))
-
-      if 'rotation' in config:
-        rotation_value = int(config['rotation'])
-        self.rotation.set(rotation_value)
-        self.rotation_label.config(text=f"{rotation_value}°")
-
-      if 'custom_x' in config:
-        self.custom_x.set(config['custom_x'])
-
-      if 'custom_y' in config:
-        self.custom_y.set(config['custom_y'])
+      # 逐项设置变量时不触发通知，载入完成后统一通知一次
+      self._suspend_notify = True
+      try:
+        if 'position' in config:
+          self.selected_position.set(config['position'])
+
+        if 'margins' in config:
+          margins = config['margins']
+          if isinstance(margins, dict):
+            self.h_margin.set(margins.get('horizontal', 20))
+            self.v_margin.set(margins.get('vertical', 20))
+
+        if 'rotation' in config:
+          rotation_value = int(config['rotation'])
+          self.rotation.set(rotation_value)
+          self._update_rotation_label(rotation_value)
+
+        if 'custom_x' in config:
+          self.custom_x.set(config['custom_x'])
+
+        if 'custom_y' in config:
+          self.custom_y.set(config['custom_y'])
+      finally:
+        self._suspend_notify = False
+      # 同步通知，使调用方的批量更新能把它与其他面板的变更合并
+      self._notify_change()
+      self._flush_notify()
 
     except Exception as e:
       self.logger.error(f"加载位置配置失败: {str(e)}")
@@ -315,27 +548,11 @@ class PositionControlPanel:
     try:
       img_w, img_h = image_size
       wm_w, wm_h = watermark_size
-      h_margin = self.h_margin.get()
-      v_margin = self.v_margin.get()
-
-      position = self.selected_position.get()
-
-      # 计算基础位置
-      if position.startswith("top"):
-        y = v_margin
-      elif position.startswith("middle"):
-        y = (img_h - wm_h) // 2
-      else:  # bottom
-        y = img_h - wm_h - v_margin
-
-      if position.endswith("left"):
-        x = h_margin
-      elif position.endswith("center"):
-        x = (img_w - wm_w) // 2
-      else:  # right
-        x = img_w - wm_w - h_margin
-
-      return (x, y)
+      calc = self._POS_FUNCS.get(
+          self._position_cached, self._POS_FUNCS["bottom_right"])
+
+      return calc(img_w, img_h, wm_w, wm_h,
+                  self._h_margin_cached, self._v_margin_cached)
 
     except Exception as e:
       self.logger.error(f"计算位置坐标失败: {str(e)}")
@@ -7,6 +7,8 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Callable, Tuple
 from PIL import Image, ImageTk
 
@@ -16,6 +18,13 @@ logger = logging.getLogger(__name__)
 class PreviewPanel:
   """预览面板"""
 
+  # 缩放后显示图像的缓存数量
+  _DISPLAY_CACHE_SIZE = 4
+  # 画布尺寸未知时预览底图的最大边长
+  _PREVIEW_BASE_SIZE = 2048
+  # 画布尚未显示时用于布局的默认尺寸
+  _DEFAULT_CANVAS_SIZE = (800, 600)
+
   def __init__(self, parent: tk.Widget,
                on_position_change: Optional[Callable[[
                    Tuple[int, int]], None]] = None,
@@ -38,7 +47,6 @@ class PreviewPanel:
     self.display_image = None
     self.canvas_image = None
     self.scale_factor = 1.0
-    self.image_position = (0, 0)
 
     # 图片信息显示
     self.image_info = ""
@@ -52,9 +60,64 @@ class PreviewPanel:
     self.watermark_bounds = None  # 水印边界 (x, y, width, height)
     self.is_dragging_watermark = False  # 是否正在拖拽水印
     self.watermark_drag_offset = (0, 0)  # 拖拽偏移
-    self.show_alignment_guides = False  # 是否显示对齐线
-    self.alignment_lines = []  # 对齐线列表
-    self.preview_image = None  # 保存预览图像引用
+
+    # 按缩放比例缓存的显示图像，来回缩放时无需重复缩放原图
+    self._display_cache = OrderedDict()
+    # 大图的缩小版底图，缩小显示时从它缩放而不是从原图缩放
+    self._preview_base = None
+    # 按 (模式, 宽, 高) 复用的 (PhotoImage, 当前显示的PIL图像)，
+    # 尺寸相同时只替换像素，显示的正是同一图像时连像素也不用替换
+    self._photo_pool = OrderedDict()
+    # 画布上常驻的图像项，显示新图像时原地更新
+    self._image_item = None
+    # 常驻的水印边界框图形项 [边框, 四个角]
+    self._wmb_ids = None
+    # 图像项的中心坐标，以及当前PhotoImage对应的图像和缩放比例
+    self._image_xy = (0, 0)
+    self._shown_image = None
+    self._shown_scale = None
+    # 上次设置的滚动区域，未变化时不再配置画布
+    self._scrollregion = None
+
+    # 滚轮和缩放按钮累积的待应用缩放比例及其定时器，连续缩放只渲染一次
+    self._pending_scale = None
+    self._zoom_after_id = None
+
+    # 画布尺寸变化触发的重绘合并定时器
+    self._configure_after_id = None
+    # 由<Configure>事件维护的画布尺寸，避免每次都向Tk查询
+    self._last_canvas_size = (0, 0)
+    # 图像偏移缓存，及计算它时的 (缩放比例, 画布尺寸) 和图像
+    self._image_offset = (0, 0)
+    self._image_offset_key = None
+    self._image_offset_source = None
+
+    # 原图尺寸；调用方传入已缩放的预览图时与current_image尺寸不同
+    self._source_size = (0, 0)
+    # 已缩放预览图对应的缩放比例，比例未变时按预览图自身尺寸显示
+    self._presized_scale = None
+    # 水印x、y方向的吸附目标 (起始边缘, 结束边缘, 居中)
+    self._snap_x = (0, 0, 0)
+    self._snap_y = (0, 0, 0)
+    # 对齐线表及其对应的尺寸、缩放和偏移；上一帧是否画了对齐线
+    self._guides = []
+    self._guides_key = None
+    # 水印在画布上的矩形缓存及其对应的 (水印边界, 缩放比例, 偏移)
+    self._wm_canvas_rect = (0, 0, 0, 0)
+    self._wm_canvas_rect_key = None
+    self._had_guides = False
+
+    # 交互（滚轮缩放、拖拽水印）期间使用快速重采样，停止后再高质量重绘
+    self._interactive = False
+    self._hq_after_id = None
+    # 当前显示的是否为快速重采样的结果
+    self._display_is_draft = False
+
+    # 高质量缩放在后台线程执行，主线程先显示草稿；任务编号用于丢弃过期结果
+    self._resize_pool = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="preview_resize")
+    self._resize_job = 0
+    self._resize_future = None
 
     # 创建界面
     self._create_widgets()
@@ -158,7 +221,8 @@ class PreviewPanel:
     except Exception as e:
       self.logger.error(f"创建预览界面失败: {str(e)}")
 
-  def update_preview(self, image: Image.Image, image_info: str = "", watermark_bounds: Tuple[int, int, int, int] = None):
+  def update_preview(self, image: Image.Image, image_info: str = "", watermark_bounds: Tuple[int, int, int, int] = None,
+                     source_size: Optional[Tuple[int, int]] = None):
     """
     更新预览图像
 
@@ -166,14 +230,41 @@ class PreviewPanel:
         image: PIL图像对象
         image_info: 图像信息字符串
         watermark_bounds: 水印边界 (x, y, width, height) 在原图坐标系中
+        source_size: 调用方已把image缩放到显示尺寸时，传入对应的原图尺寸；
+            此时直接按该比例显示，不再适应窗口和重新缩放
     """
     try:
+      # 图像变化后旧的缩放结果全部失效
+      if image is not self.current_image:
+        self._display_cache.clear()
+        self._preview_base = self._create_preview_base(image)
+
       self.current_image = image
-      self.preview_image = image  # 保存引用
       self.image_info = image_info
       self.watermark_bounds = watermark_bounds
-
-      if image:
+      # 坐标换算使用的原图尺寸
+      self._source_size = (source_size or image.size) if image else (0, 0)
+      self._presized_scale = None
+
+      # 水印左上角的吸附目标（左/右边缘、居中），拖拽时直接比较
+      if image and watermark_bounds:
+        img_width, img_height = self._source_size
+        wm_width, wm_height = watermark_bounds[2], watermark_bounds[3]
+        self._snap_x = (0, img_width - wm_width,
+                        img_width // 2 - wm_width // 2)
+        self._snap_y = (0, img_height - wm_height,
+                        img_height // 2 - wm_height // 2)
+
+      if image and source_size:
+        # 已是显示尺寸的图像按原样显示
+        self._cancel_pending_zoom()
+        self.scale_factor = image.width / source_size[0]
+        self._presized_scale = self.scale_factor
+        self._display_image()
+        self._update_info_label()
+        if watermark_bounds:
+          self._draw_watermark_bounds()
+      elif image:
         # 每次加载新图片时都自动适应窗口
         self._fit_to_window()
         self._update_info_label()
@@ -194,8 +285,14 @@ class PreviewPanel:
       self.canvas_image = None
       self.scale_factor = 1.0
       self.image_info = ""
-
-      self.canvas.delete("all")
+      self._display_cache.clear()
+      self._photo_pool.clear()
+      self._preview_base = None
+      self._image_offset_source = None
+      self._source_size = (0, 0)
+      self._presized_scale = None
+
+      # _show_placeholder会清空画布
       self._show_placeholder()
       self._update_scale_label()
       self._update_info_label()
@@ -209,56 +306,247 @@ class PreviewPanel:
       if not self.current_image:
         return
 
-      # 计算显示尺寸
-      display_width = int(self.current_image.width * self.scale_factor)
-      display_height = int(self.current_image.height * self.scale_factor)
+      self._rebuild_photo_image()
+
+      # 清除占位符和对齐线，隐藏边界框，图像项和边界框本身保留
+      self.canvas.delete('placeholder', 'alignment_guide')
+      self.canvas.itemconfigure('watermark_bounds', state='hidden')
+
+      self._reposition_image()
+
+      # 更新缩放标签和信息标签
+      self._update_scale_label()
+      self._update_info_label()
+
+    except Exception as e:
+      self.logger.error(f"显示图像失败: {str(e)}")
 
-      # 调整图像大小
-      if self.scale_factor != 1.0:
-        self.display_image = self.current_image.resize(
-            (display_width, display_height), Image.Resampling.LANCZOS)
+  def _rebuild_photo_image(self):
+    """按当前缩放比例生成显示图像并更新PhotoImage（像素变化时调用）"""
+    display_width, display_height = self._display_size()
+
+    # 调整图像大小（优先使用相同缩放比例的缓存结果）
+    was_draft = self._display_is_draft
+    self._display_is_draft = False
+    if (display_width, display_height) != self.current_image.size:
+      cache_key = round(self.scale_factor, 3)
+      resized = self._display_cache.get(cache_key)
+      if resized is None:
+        source = self.current_image
+        if self._preview_base and display_width <= self._preview_base.width:
+          source = self._preview_base
+        if (was_draft and self._shown_image is self.current_image and
+                self._shown_scale == self.scale_factor):
+          # 已显示的草稿就是这一帧，直接沿用
+          resized = self.display_image
+        else:
+          # 先用双线性插值出草稿立即显示，草稿结果不进入缓存；
+          # reducing_gap=1.0让Pillow先按最大整数倍做盒式缩小
+          resized = source.resize(
+              (display_width, display_height), Image.Resampling.BILINEAR,
+              reducing_gap=1.0)
+        self._display_is_draft = True
+        if not self._interactive:
+          self._request_hq_resize(source, (display_width, display_height),
+                                  cache_key)
       else:
-        self.display_image = self.current_image
+        self._display_cache.move_to_end(cache_key)
+      self.display_image = resized
+    else:
+      self.display_image = self.current_image
+
+    # 转换为Tkinter可用格式（尺寸相同时复用已有的PhotoImage）
+    self.canvas_image = self._get_photo_image(self.display_image)
+    self._shown_image = self.current_image
+    self._shown_scale = self.scale_factor
+    if self._image_item is not None:
+      self.canvas.itemconfig(self._image_item, image=self.canvas_image)
+
+  def _reposition_image(self):
+    """把图像项移到画布中央并更新滚动区域（只有位置变化时调用）"""
+    display_width, display_height = self.display_image.size
+
+    # 计算居中位置（画布尚未显示时按默认尺寸）
+    x, y = self._center_xy()
+    canvas_width, canvas_height = self._canvas_size(self._DEFAULT_CANVAS_SIZE)
+
+    # 显示图像（已有图像项时只移动坐标，水印边界框随图像平移）
+    if self._image_item is None:
+      self._image_item = self.canvas.create_image(
+          x, y, image=self.canvas_image, anchor=tk.CENTER, tags="image")
+    elif (x, y) != self._image_xy:
+      self.canvas.coords(self._image_item, x, y)
+      self.canvas.move('watermark_bounds', x - self._image_xy[0],
+                       y - self._image_xy[1])
+    self._image_xy = (x, y)
+
+    # 更新画布滚动区域（由图像尺寸直接得出，无需bbox("all")）
+    scrollregion = (0, 0, max(display_width, canvas_width),
+                    max(display_height, canvas_height))
+    if scrollregion != self._scrollregion:
+      self.canvas.configure(scrollregion=scrollregion)
+      self._scrollregion = scrollregion
+
+  def _begin_interaction(self):
+    """进入交互状态，停止操作150ms后恢复高质量重采样"""
+    self._interactive = True
+    if self._hq_after_id:
+      self.canvas.after_cancel(self._hq_after_id)
+    self._hq_after_id = self.canvas.after(150, self._settle)
+
+  def _settle(self):
+    """交互结束，如当前显示的是草稿则用LANCZOS重绘一次"""
+    try:
+      self._hq_after_id = None
+      if self.is_dragging_watermark:
+        # 鼠标仍按住时暂不重绘，避免清掉对齐线
+        self._hq_after_id = self.canvas.after(150, self._settle)
+        return
+      self._interactive = False
+      if self._display_is_draft and self.current_image:
+        # 沿用已显示的草稿，只提交高质量缩放，叠加图形不受影响
+        self._rebuild_photo_image()
+    except Exception as e:
+      self.logger.error(f"高质量重绘失败: {str(e)}")
 
-      # 转换为Tkinter可用格式
-      self.canvas_image = ImageTk.PhotoImage(self.display_image)
+  def _request_hq_resize(self, source: Image.Image, size: Tuple[int, int],
+                         cache_key: float):
+    """
+    在后台线程执行高质量缩放，完成后回到主线程替换草稿
 
-      # 清空画布
-      self.canvas.delete("all")
+    Args:
+        source: 缩放源图像
+        size: 目标尺寸
+        cache_key: 显示缓存键（缩放比例）
+    """
+    # 尚未开始的旧任务直接取消
+    if self._resize_future:
+      self._resize_future.cancel()
+
+    self._resize_job += 1
+    job = self._resize_job
+    image = self.current_image
+    # 缩小时BICUBIC与LANCZOS肉眼无差别，放大时才用LANCZOS
+    resample = (Image.Resampling.LANCZOS if size[0] > image.width
+                else Image.Resampling.BICUBIC)
+    # 缩小倍数较大时先用Image.reduce做整数倍盒式缩小，剩余部分再精细重采样
+    future = self._resize_pool.submit(source.resize, size, resample,
+                                      reducing_gap=2.0)
+    self._resize_future = future
+
+    def done(f: Future):
+      try:
+        self.canvas.after(0, self._on_resize_done, job, image, cache_key, f)
+      except (RuntimeError, tk.TclError):
+        # 窗口已关闭
+        pass
+
+    future.add_done_callback(done)
+
+  def _on_resize_done(self, job: int, image: Image.Image, cache_key: float,
+                      future: Future):
+    """后台缩放完成（主线程）：写入缓存，仍显示对应草稿时替换为高质量结果"""
+    try:
+      if future.cancelled() or image is not self.current_image:
+        return
+      resized = future.result()
 
-      # 计算居中位置
-      canvas_width = self.canvas.winfo_width()
-      canvas_height = self.canvas.winfo_height()
+      self._display_cache[cache_key] = resized
+      if len(self._display_cache) > self._DISPLAY_CACHE_SIZE:
+        self._display_cache.popitem(last=False)
 
-      if canvas_width <= 1 or canvas_height <= 1:
-        # 画布尚未显示，使用默认值
-        canvas_width = 800
-        canvas_height = 600
+      if (job == self._resize_job and self._display_is_draft and
+              self._shown_image is image and
+              round(self._shown_scale, 3) == cache_key):
+        # 尺寸不变，只替换像素，图像项和叠加图形保持原样
+        self._rebuild_photo_image()
+    except Exception as e:
+      self.logger.error(f"后台缩放失败: {str(e)}")
 
-      x = max(display_width // 2, canvas_width // 2)
-      y = max(display_height // 2, canvas_height // 2)
+  def destroy(self):
+    """清理资源"""
+    try:
+      self._resize_pool.shutdown(wait=False, cancel_futures=True)
+      self._display_cache.clear()
+      self._photo_pool.clear()
+    except Exception as e:
+      self.logger.error(f"清理资源失败: {str(e)}")
 
-      # 显示图像
-      self.canvas.create_image(
-          x, y, image=self.canvas_image, anchor=tk.CENTER, tags="image")
+  def _get_photo_image(self, image: Image.Image) -> ImageTk.PhotoImage:
+    """
+    获取显示用的PhotoImage，相同模式和尺寸的PhotoImage直接粘贴新像素复用，
+    缓存已满时回收最久未用的同模式PhotoImage
 
-      # 更新画布滚动区域
-      self.canvas.configure(scrollregion=(0, 0, max(display_width, canvas_width),
-                                          max(display_height, canvas_height)))
+    Args:
+        image: 要显示的PIL图像
 
-      # 更新缩放标签和信息标签
-      self._update_scale_label()
-      self._update_info_label()
+    Returns:
+        PhotoImage对象
+    """
+    key = (image.mode, image.width, image.height)
+    entry = self._photo_pool.get(key)
+    if entry is None:
+      photo = None
+      if len(self._photo_pool) >= self._DISPLAY_CACHE_SIZE:
+        (mode, _, _), (old_photo, _) = self._photo_pool.popitem(last=False)
+        if mode == image.mode:
+          # 回收被淘汰的PhotoImage：调整Tk图像尺寸后粘贴新像素，不再新建Tk图像
+          old_photo.tk.call(str(old_photo), 'configure',
+                            '-width', image.width, '-height', image.height)
+          old_photo.paste(image)
+          photo = old_photo
+      if photo is None:
+        photo = ImageTk.PhotoImage(image)
+    else:
+      photo, shown = entry
+      if shown is not image:
+        photo.paste(image)
+      self._photo_pool.move_to_end(key)
+    self._photo_pool[key] = (photo, image)
+    return photo
+
+  def _create_preview_base(self, image: Optional[Image.Image]) -> Optional[Image.Image]:
+    """
+    为大图生成缩小的预览底图，尺寸为画布的2倍，适应窗口和小幅放大都从它缩放
+
+    Args:
+        image: 原始预览图像
+
+    Returns:
+        缩小后的底图，图像本身不超过画布2倍时返回None
+    """
+    try:
+      if not image:
+        return None
+
+      canvas_width, canvas_height = self._canvas_size()
+      if canvas_width <= 1 or canvas_height <= 1:
+        # 画布尚未显示时按固定边长处理
+        target_width = target_height = self._PREVIEW_BASE_SIZE
+      else:
+        target_width, target_height = canvas_width * 2, canvas_height * 2
 
+      ratio = min(target_width / image.width, target_height / image.height)
+      if ratio >= 1.0:
+        return None
+
+      base_size = (max(1, round(image.width * ratio)),
+                   max(1, round(image.height * ratio)))
+      # reducing_gap先做整数倍的盒式缩小，再用BICUBIC完成剩余部分
+      return image.resize(base_size, Image.Resampling.BICUBIC,
+                          reducing_gap=2.0)
     except Exception as e:
-      self.logger.error(f"显示图像失败: {str(e)}")
+      self.logger.error(f"生成预览底图失败: {str(e)}")
+      return None
 
   def _show_placeholder(self):
     """显示占位符文本"""
     try:
       self.canvas.delete("all")
-      canvas_width = self.canvas.winfo_width()
-      canvas_height = self.canvas.winfo_height()
+      self._image_item = None
+      self._wmb_ids = None
+      self._shown_image = None
+      canvas_width, canvas_height = self._canvas_size()
 
       if canvas_width <= 1:
         canvas_width = 400
@@ -268,7 +556,7 @@ class PreviewPanel:
       self.canvas.create_text(canvas_width // 2, canvas_height // 2,
                               text="请选择图片进行预览",
                               font=('Arial', 14), fill='gray',
-                              anchor=tk.CENTER)
+                              anchor=tk.CENTER, tags='placeholder')
     except Exception as e:
       self.logger.error(f"显示占位符失败: {str(e)}")
 
@@ -276,8 +564,7 @@ class PreviewPanel:
     """放大"""
     try:
       if self.current_image:
-        self.scale_factor = min(5.0, self.scale_factor * 1.2)
-        self._display_image()
+        self._queue_zoom(1.2)
     except Exception as e:
       self.logger.error(f"放大失败: {str(e)}")
 
@@ -285,8 +572,7 @@ class PreviewPanel:
     """缩小"""
     try:
       if self.current_image:
-        self.scale_factor = max(0.1, self.scale_factor / 1.2)
-        self._display_image()
+        self._queue_zoom(1 / 1.2)
     except Exception as e:
       self.logger.error(f"缩小失败: {str(e)}")
 
@@ -296,15 +582,16 @@ class PreviewPanel:
       if not self.current_image:
         return
 
-      canvas_width = self.canvas.winfo_width()
-      canvas_height = self.canvas.winfo_height()
+      canvas_width, canvas_height = self._canvas_size()
 
       if canvas_width <= 1 or canvas_height <= 1:
         return
 
+      self._cancel_pending_zoom()
+
       # 计算缩放比例
-      width_ratio = canvas_width / self.current_image.width
-      height_ratio = canvas_height / self.current_image.height
+      width_ratio = canvas_width / self._source_size[0]
+      height_ratio = canvas_height / self._source_size[1]
       self.scale_factor = min(width_ratio, height_ratio, 1.0)  # 不放大
 
       self._display_image()
@@ -316,6 +603,7 @@ class PreviewPanel:
     """实际大小"""
     try:
       if self.current_image:
+        self._cancel_pending_zoom()
         self.scale_factor = 1.0
         self._display_image()
     except Exception as e:
@@ -381,11 +669,8 @@ class PreviewPanel:
         if self.watermark_bounds:
           canvas_x = self.canvas.canvasx(event.x)
           canvas_y = self.canvas.canvasy(event.y)
-          offset_x, offset_y = self._get_image_offset()
-          watermark_canvas_x = offset_x + \
-              self.watermark_bounds[0] * self.scale_factor
-          watermark_canvas_y = offset_y + \
-              self.watermark_bounds[1] * self.scale_factor
+          watermark_canvas_x, watermark_canvas_y = \
+              self._get_watermark_canvas_rect()[:2]
           self.watermark_drag_offset = (
               canvas_x - watermark_canvas_x,
               canvas_y - watermark_canvas_y
@@ -399,6 +684,7 @@ class PreviewPanel:
     try:
       if self.is_dragging_watermark:
         # 拖拽水印
+        self._begin_interaction()
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
 
@@ -419,12 +705,12 @@ class PreviewPanel:
             watermark_width = self.watermark_bounds[2]
             watermark_height = self.watermark_bounds[3]
             img_x = max(
-                0, min(img_x, self.current_image.width - watermark_width))
+                0, min(img_x, self._source_size[0] - watermark_width))
             img_y = max(
-                0, min(img_y, self.current_image.height - watermark_height))
+                0, min(img_y, self._source_size[1] - watermark_height))
           else:
-            img_x = max(0, min(img_x, self.current_image.width))
-            img_y = max(0, min(img_y, self.current_image.height))
+            img_x = max(0, min(img_x, self._source_size[0]))
+            img_y = max(0, min(img_y, self._source_size[1]))
 
           # 绘制辅助对齐线
           self._draw_alignment_guides(img_x, img_y)
@@ -460,220 +746,283 @@ class PreviewPanel:
     """鼠标滚轮事件"""
     try:
       if self.current_image:
-        if event.delta > 0:
-          self._zoom_in()
-        else:
-          self._zoom_out()
+        self._begin_interaction()
+        self._queue_zoom(1.2 if event.delta > 0 else 1 / 1.2)
     except Exception as e:
       self.logger.error(f"处理鼠标滚轮失败: {str(e)}")
 
+  def _queue_zoom(self, factor: float):
+    """
+    累积缩放比例，短时间内的连续缩放合并为一次重绘
+
+    Args:
+        factor: 相对当前（或待应用）缩放比例的倍数
+    """
+    current = self._pending_scale or self.scale_factor
+    self._pending_scale = max(0.1, min(5.0, current * factor))
+    # 缩放标签立即更新，图像在合并后只重采样一次
+    self.scale_label.config(text=f"{int(self._pending_scale * 100)}%")
+    if self._zoom_after_id is None:
+      self._zoom_after_id = self.canvas.after(30, self._apply_pending_zoom)
+
+  def _cancel_pending_zoom(self):
+    """取消尚未应用的缩放"""
+    if self._zoom_after_id:
+      self.canvas.after_cancel(self._zoom_after_id)
+      self._zoom_after_id = None
+    self._pending_scale = None
+
+  def _apply_pending_zoom(self):
+    """应用累积的缩放"""
+    try:
+      self._zoom_after_id = None
+      scale = self._pending_scale
+      self._pending_scale = None
+      if scale and self.current_image:
+        self.scale_factor = scale
+        self._display_image()
+    except Exception as e:
+      self.logger.error(f"应用缩放失败: {str(e)}")
+
   def _on_canvas_configure(self, event):
     """画布配置改变事件"""
     try:
-      # 窗口大小改变时重新显示图像
+      size = (event.width, event.height)
+      if size == self._last_canvas_size:
+        return
+      self._last_canvas_size = size
+
+      # 窗口大小改变时重新显示图像（拖动窗口时合并为一次重绘）
       if self.current_image:
-        self._display_image()
+        self._schedule_redraw()
+      else:
+        # 没有图像时只把占位文本移到新的中心，不重建画布内容
+        self.canvas.coords('placeholder', event.width // 2, event.height // 2)
     except Exception as e:
       self.logger.error(f"处理画布配置改变失败: {str(e)}")
 
-  def _get_image_offset(self) -> Tuple[int, int]:
-    """获取图像在画布上的偏移量（用于居中显示）"""
-    try:
-      if not self.display_image:
-        return (0, 0)
+  def _schedule_redraw(self):
+    """60ms内的多次画布尺寸变化合并为一次重绘"""
+    if self._configure_after_id:
+      self.canvas.after_cancel(self._configure_after_id)
+    self._configure_after_id = self.canvas.after(60, self._do_configure_redraw)
 
-      canvas_width = self.canvas.winfo_width()
-      canvas_height = self.canvas.winfo_height()
+  def _do_configure_redraw(self):
+    """执行合并后的重绘"""
+    try:
+      self._configure_after_id = None
+      if self.current_image:
+        # 画布变大后底图不足2倍画布时按新尺寸重建
+        base = self._preview_base
+        if base and (base.width < self._last_canvas_size[0] * 2 and
+                     base.height < self._last_canvas_size[1] * 2):
+          self._preview_base = self._create_preview_base(self.current_image)
+
+        if (self._image_item is not None and not self._display_is_draft and
+                self._shown_image is self.current_image and
+                self._shown_scale == self.scale_factor):
+          # 缩放比例未变（如调整窗口大小），像素无需重建，只重新居中
+          self.canvas.delete('alignment_guide')
+          self._reposition_image()
+        else:
+          self._display_image()
+    except Exception as e:
+      self.logger.error(f"重绘预览失败: {str(e)}")
 
-      if canvas_width <= 1 or canvas_height <= 1:
-        canvas_width = 800
-        canvas_height = 600
+  def _canvas_size(self, fallback: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+    """
+    获取画布尺寸，尚未收到<Configure>事件时才向Tk查询
 
-      display_width = int(self.current_image.width * self.scale_factor)
-      display_height = int(self.current_image.height * self.scale_factor)
+    Args:
+        fallback: 画布尚未显示（尺寸不大于1）时返回的默认尺寸
 
-      # 计算居中位置时的偏移
-      offset_x = max(0, (canvas_width - display_width) // 2)
-      offset_y = max(0, (canvas_height - display_height) // 2)
+    Returns:
+        画布尺寸 (width, height)
+    """
+    if self._last_canvas_size[0] > 1 and self._last_canvas_size[1] > 1:
+      return self._last_canvas_size
+    size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+    if fallback and (size[0] <= 1 or size[1] <= 1):
+      return fallback
+    return size
+
+  def _display_size(self) -> Tuple[int, int]:
+    """按当前缩放比例计算的显示尺寸"""
+    if (self._presized_scale is not None and self.current_image and
+            self.scale_factor == self._presized_scale):
+      # 调用方已缩放好的预览图原样显示，避免取整差1像素导致再缩放一次
+      return self.current_image.size
+    return (int(self._source_size[0] * self.scale_factor),
+            int(self._source_size[1] * self.scale_factor))
+
+  def _center_xy(self) -> Tuple[int, int]:
+    """图像项的中心坐标：图像小于画布时居中于画布，否则位于图像自身中心"""
+    canvas_width, canvas_height = self._canvas_size(self._DEFAULT_CANVAS_SIZE)
+    display_width, display_height = self._display_size()
+    return (max(display_width, canvas_width) // 2,
+            max(display_height, canvas_height) // 2)
 
-      return (offset_x, offset_y)
-    except Exception as e:
-      self.logger.error(f"获取图像偏移失败: {str(e)}")
+  def _get_image_offset(self) -> Tuple[int, int]:
+    """获取图像在画布上的偏移量（用于居中显示）"""
+    if not self.display_image:
       return (0, 0)
 
-  def _is_point_in_watermark(self, x: int, y: int) -> bool:
-    """检查点是否在水印范围内"""
-    try:
-      if not self.watermark_bounds or not self.scale_factor:
-        return False
+    # 缩放比例、画布尺寸和图像都未变化时直接返回缓存的偏移
+    key = (self.scale_factor, self._last_canvas_size)
+    if (self._image_offset_key == key and
+            self._image_offset_source is self.current_image):
+      return self._image_offset
 
-      canvas_x = self.canvas.canvasx(x)
-      canvas_y = self.canvas.canvasy(y)
+    # 图像左上角 = 中心坐标 - 一半尺寸，与Tk按CENTER锚点放置图像的取整一致
+    center_x, center_y = self._center_xy()
+    display_width, display_height = self._display_size()
+    offset_x = center_x - display_width // 2
+    offset_y = center_y - display_height // 2
 
-      # 获取图像偏移
-      offset_x, offset_y = self._get_image_offset()
+    self._image_offset = (offset_x, offset_y)
+    self._image_offset_key = key
+    self._image_offset_source = self.current_image
+    return self._image_offset
 
-      # 水印在画布上的位置和大小（考虑图像偏移）
-      wm_x = offset_x + self.watermark_bounds[0] * self.scale_factor
-      wm_y = offset_y + self.watermark_bounds[1] * self.scale_factor
-      wm_width = self.watermark_bounds[2] * self.scale_factor
-      wm_height = self.watermark_bounds[3] * self.scale_factor
+  def _get_watermark_canvas_rect(self) -> Tuple[float, float, float, float]:
+    """
+    获取水印在画布上的矩形，水印边界、缩放比例和图像偏移不变时复用
 
-      # 检查点是否在矩形内
-      return (wm_x <= canvas_x <= wm_x + wm_width and
-              wm_y <= canvas_y <= wm_y + wm_height)
-    except Exception as e:
-      self.logger.error(f"检查水印点击失败: {str(e)}")
+    Returns:
+        (左, 上, 右, 下) 画布坐标
+    """
+    offset_x, offset_y = self._get_image_offset()
+    key = (self.watermark_bounds, self.scale_factor, offset_x, offset_y)
+    if key != self._wm_canvas_rect_key:
+      wm_x, wm_y, wm_width, wm_height = self.watermark_bounds
+      scale = self.scale_factor
+      left = offset_x + wm_x * scale
+      top = offset_y + wm_y * scale
+      self._wm_canvas_rect = (left, top,
+                              left + wm_width * scale, top + wm_height * scale)
+      self._wm_canvas_rect_key = key
+    return self._wm_canvas_rect
+
+  def _is_point_in_watermark(self, x: int, y: int) -> bool:
+    """检查点是否在水印范围内"""
+    if not self.watermark_bounds or not self.scale_factor:
       return False
 
+    left, top, right, bottom = self._get_watermark_canvas_rect()
+    canvas_x = self.canvas.canvasx(x)
+    return left <= canvas_x <= right and top <= self.canvas.canvasy(y) <= bottom
+
   def _draw_watermark_bounds(self):
-    """绘制水印边界框"""
+    """绘制水印边界框（边框和四个角的控制点常驻画布，每次只更新坐标）"""
     try:
       if not self.watermark_bounds or not self.scale_factor:
         return
 
-      # 删除旧的边界框
-      self.canvas.delete('watermark_bounds')
-
-      # 获取图像偏移
-      offset_x, offset_y = self._get_image_offset()
-
-      # 计算边界框在画布上的位置（考虑图像偏移）
-      x = offset_x + self.watermark_bounds[0] * self.scale_factor
-      y = offset_y + self.watermark_bounds[1] * self.scale_factor
-      width = self.watermark_bounds[2] * self.scale_factor
-      height = self.watermark_bounds[3] * self.scale_factor
-
-      # 绘制虚线边界框
-      self.canvas.create_rectangle(
-          x, y, x + width, y + height,
-          outline='blue',
-          width=2,
-          dash=(5, 3),
-          tags='watermark_bounds'
-      )
-
-      # 绘制四个角的控制点
-      corner_size = 8
-      corners = [
-          (x, y),  # 左上
-          (x + width, y),  # 右上
-          (x, y + height),  # 左下
-          (x + width, y + height)  # 右下
-      ]
-      for cx, cy in corners:
-        self.canvas.create_rectangle(
-            cx - corner_size/2, cy - corner_size/2,
-            cx + corner_size/2, cy + corner_size/2,
-            fill='blue',
-            outline='white',
-            tags='watermark_bounds'
-        )
-    except Exception as e:
-      self.logger.error(f"绘制水印边界失败: {str(e)}")
-
-  def _draw_alignment_guides(self, img_x: int, img_y: int):
-    """绘制辅助对齐线"""
-    try:
-      # 清除旧的对齐线
-      self._clear_alignment_guides()
-
-      if not self.current_image or not self.watermark_bounds:
-        return
-
-      img_width = self.current_image.width
-      img_height = self.current_image.height
-      wm_width = self.watermark_bounds[2]
-      wm_height = self.watermark_bounds[3]
-
-      # 水印中心点
-      wm_center_x = img_x + wm_width // 2
-      wm_center_y = img_y + wm_height // 2
-
-      # 图像中心点
-      img_center_x = img_width // 2
-      img_center_y = img_height // 2
-
-      # 对齐阈值（像素）
-      threshold = 10
-
-      # 获取图像偏移
-      offset_x, offset_y = self._get_image_offset()
+      # 边界框在画布上的位置（考虑图像偏移）
+      x, y, right, bottom = self._get_watermark_canvas_rect()
 
-      # 检查水平居中对齐
-      if abs(wm_center_x - img_center_x) < threshold:
-        # 绘制垂直中心线
-        x = offset_x + img_center_x * self.scale_factor
-        self.canvas.create_line(
-            x, offset_y, x, offset_y + img_height * self.scale_factor,
-            fill='red',
-            width=1,
-            dash=(3, 3),
-            tags='alignment_guide'
-        )
+      # 四个角的控制点
+      half = 8 / 2
+      corners = ((x, y), (right, y), (x, bottom), (right, bottom))
 
-      # 检查垂直居中对齐
-      if abs(wm_center_y - img_center_y) < threshold:
-        # 绘制水平中心线
-        y = offset_y + img_center_y * self.scale_factor
-        self.canvas.create_line(
-            offset_x, y, offset_x + img_width * self.scale_factor, y,
-            fill='red',
-            width=1,
-            dash=(3, 3),
-            tags='alignment_guide'
+      if self._wmb_ids is None:
+        # 首次绘制：虚线边框和四个角的控制点
+        rect_id = self.canvas.create_rectangle(
+            x, y, right, bottom,
+            outline='blue',
+            width=2,
+            dash=(5, 3),
+            tags='watermark_bounds'
         )
+        corner_ids = [
+            self.canvas.create_rectangle(
+                cx - half, cy - half, cx + half, cy + half,
+                fill='blue',
+                outline='white',
+                tags='watermark_bounds'
+            )
+            for cx, cy in corners
+        ]
+        self._wmb_ids = [rect_id] + corner_ids
+        return
 
-      # 检查左边缘对齐
-      if abs(img_x) < threshold:
-        x = offset_x
-        self.canvas.create_line(
-            x, offset_y, x, offset_y + img_height * self.scale_factor,
-            fill='orange',
-            width=1,
-            dash=(3, 3),
-            tags='alignment_guide'
-        )
+      self.canvas.coords(self._wmb_ids[0], x, y, right, bottom)
+      for item_id, (cx, cy) in zip(self._wmb_ids[1:], corners):
+        self.canvas.coords(item_id, cx - half, cy - half, cx + half, cy + half)
+      self.canvas.itemconfigure('watermark_bounds', state='normal')
+    except Exception as e:
+      self.logger.error(f"绘制水印边界失败: {str(e)}")
 
-      # 检查右边缘对齐
-      if abs(img_x + wm_width - img_width) < threshold:
-        x = offset_x + img_width * self.scale_factor
-        self.canvas.create_line(
-            x, offset_y, x, offset_y + img_height * self.scale_factor,
-            fill='orange',
-            width=1,
-            dash=(3, 3),
-            tags='alignment_guide'
-        )
+  def _get_guide_table(self) -> list:
+    """
+    获取对齐线表，图像、水印尺寸、缩放比例和偏移不变时复用
 
-      # 检查上边缘对齐
-      if abs(img_y) < threshold:
-        y = offset_y
-        self.canvas.create_line(
-            offset_x, y, offset_x + img_width * self.scale_factor, y,
-            fill='orange',
-            width=1,
-            dash=(3, 3),
-            tags='alignment_guide'
-        )
+    Returns:
+        [(轴, 目标坐标, 颜色, 画布线段坐标), ...]，轴为0时比较水印x坐标，为1时比较y坐标
+    """
+    img_width, img_height = self._source_size
+    offset_x, offset_y = self._get_image_offset()
+    key = (self._snap_x, self._snap_y, self.scale_factor, offset_x, offset_y)
+    if key == self._guides_key:
+      return self._guides
+
+    left_x, right_x, center_target_x = self._snap_x
+    top_y, bottom_y, center_target_y = self._snap_y
+
+    scale = self.scale_factor
+    left, top = offset_x, offset_y
+    right = offset_x + img_width * scale
+    bottom = offset_y + img_height * scale
+    center_x = offset_x + (img_width // 2) * scale
+    center_y = offset_y + (img_height // 2) * scale
+
+    self._guides = [
+        # 水平居中：水印中心与图像中心对齐时画垂直中心线
+        (0, center_target_x, 'red', (center_x, top, center_x, bottom)),
+        # 垂直居中：画水平中心线
+        (1, center_target_y, 'red', (left, center_y, right, center_y)),
+        # 左、右、上、下边缘对齐
+        (0, left_x, 'orange', (left, top, left, bottom)),
+        (0, right_x, 'orange', (right, top, right, bottom)),
+        (1, top_y, 'orange', (left, top, right, top)),
+        (1, bottom_y, 'orange', (left, bottom, right, bottom)),
+    ]
+    self._guides_key = key
+    return self._guides
 
-      # 检查下边缘对齐
-      if abs(img_y + wm_height - img_height) < threshold:
-        y = offset_y + img_height * self.scale_factor
+  def _draw_alignment_guides(self, img_x: int, img_y: int):
+    """绘制辅助对齐线"""
+    # 清除旧的对齐线
+    self._clear_alignment_guides()
+
+    if not self.current_image or not self.watermark_bounds:
+      return
+
+    # 对齐阈值（像素）
+    threshold = 10
+
+    # 先用水印到各吸附目标的最小距离判断，远离所有对齐线时直接返回
+    x0, x1, x2 = self._snap_x
+    y0, y1, y2 = self._snap_y
+    min_dx = min(abs(img_x - x0), abs(img_x - x1), abs(img_x - x2))
+    min_dy = min(abs(img_y - y0), abs(img_y - y1), abs(img_y - y2))
+    if min_dx >= threshold and min_dy >= threshold:
+      return
+
+    position = (img_x, img_y)
+    for axis, target, color, coords in self._get_guide_table():
+      if abs(position[axis] - target) < threshold:
         self.canvas.create_line(
-            offset_x, y, offset_x + img_width * self.scale_factor, y,
-            fill='orange',
+            *coords,
+            fill=color,
             width=1,
             dash=(3, 3),
             tags='alignment_guide'
         )
-
-    except Exception as e:
-      self.logger.error(f"绘制对齐线失败: {str(e)}")
+        self._had_guides = True
 
   def _clear_alignment_guides(self):
-    """清除对齐线"""
-    try:
+    """清除对齐线（上一帧没有画对齐线时跳过）"""
+    if self._had_guides:
       self.canvas.delete('alignment_guide')
-    except Exception as e:
-      self.logger.error(f"清除对齐线失败: {str(e)}")
+      self._had_guides = False
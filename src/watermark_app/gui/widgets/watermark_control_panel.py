@@ -7,18 +7,42 @@
 import tkinter as tk
 from tkinter import ttk, colorchooser, font
 import logging
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List, Sequence
 import os
 import sys
 import platform
 from pathlib import Path
 
+from ...utils.constants import WATERMARK_IMAGE_FILETYPES
+
 logger = logging.getLogger(__name__)
 
+# 当前平台，导入时确定一次
+_OS = platform.system()
+
+# 当前平台优先显示的常用字体
+_PRIORITY_FONTS = {
+    "Windows": ['微软雅黑', '宋体', 'Arial', 'Times New Roman', 'Calibri'],
+    "Darwin": ['苹方-简', 'Helvetica', 'Times', 'Arial'],
+}.get(_OS, ['Noto Sans CJK SC', 'DejaVu Sans', 'Liberation Sans', 'Arial'])
+
+# 没有可用系统字体、或枚举字体出错时使用的备用字体
+_FALLBACK_FONTS = ('Arial', 'Helvetica', 'Sans')
+_ERROR_FALLBACK_FONTS = ('Arial', 'Helvetica', 'Times New Roman', 'Courier New')
+
+# 系统字体列表缓存，避免每次创建面板都枚举系统字体
+_FONT_CACHE: Optional[Sequence[str]] = None
+
 
 class WatermarkControlPanel:
   """水印控制面板"""
 
+  # 变更通知的防抖时长（毫秒）：复选框、下拉框等离散操作立即通知；
+  # 滑块和数值框合并连续变化；逐键输入的文本等待更长的停顿
+  _DISCRETE_DELAY_MS = 0
+  _SLIDER_DELAY_MS = 80
+  _TEXT_DELAY_MS = 150
+
   def __init__(self, parent: tk.Widget,
                on_watermark_change: Optional[Callable[[], None]] = None,
                config_manager=None):
@@ -35,6 +59,22 @@ class WatermarkControlPanel:
     self.config_manager = config_manager
     self.logger = logging.getLogger(__name__)
 
+    # 滑块拖动、连续输入时的变更通知防抖定时器
+    self._change_after_id = None
+    # 批量载入或重置设置期间暂停变更通知
+    self._suspend_notify = False
+    # 是否正在拖动滑块（拖动期间主窗口以低分辨率渲染预览）
+    self._dragging = False
+    # get_config的缓存，设置变量写入时逐项更新
+    self._config_cache = None
+    # 颜色按钮在文本设置框首次显示时才创建
+    self.color_button: Optional[tk.Button] = None
+    # 颜色按钮当前背景色，颜色未变时不重设背景（避免无谓重绘）
+    self._color_button_bg: Optional[str] = None
+    # 描边设置行及其中按需构建的描边宽度控件
+    self._stroke_frame: Optional[ttk.Frame] = None
+    self._stroke_width_frame: Optional[ttk.Frame] = None
+
     # 创建界面
     self._create_widgets()
 
@@ -45,144 +85,25 @@ class WatermarkControlPanel:
       main_frame = ttk.Frame(self.parent)
       main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+      # 设置变量先全部创建，get_config/load_config不依赖具体控件是否已构建
+      self._create_variables()
+
       # 水印类型选择
       type_frame = ttk.LabelFrame(main_frame, text="水印类型")
       type_frame.pack(fill=tk.X, pady=5)
 
-      self.watermark_type = tk.StringVar(value="text")
       ttk.Radiobutton(type_frame, text="文本水印", variable=self.watermark_type,
                       value="text", command=self._on_type_change).pack(anchor=tk.W)
       ttk.Radiobutton(type_frame, text="图片水印", variable=self.watermark_type,
                       value="image", command=self._on_type_change).pack(anchor=tk.W)
 
-      # 文本水印设置
+      # 文本/图片设置框内的控件在首次显示时才构建
       self.text_frame = ttk.LabelFrame(main_frame, text="文本设置")
-      self.text_frame.pack(fill=tk.X, pady=5)
-
-      # 文本内容
-      ttk.Label(self.text_frame, text="文本内容:").pack(anchor=tk.W)
-      self.text_entry = ttk.Entry(self.text_frame, width=30)
-      self.text_entry.pack(fill=tk.X, pady=2)
-      self.text_entry.insert(0, "水印文本")
-      self.text_entry.bind('<KeyRelease>', self._on_text_change)
-
-      # 字体大小
-      size_frame = ttk.Frame(self.text_frame)
-      size_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(size_frame, text="字体大小:").pack(side=tk.LEFT)
-      self.font_size = tk.IntVar(value=36)
-      size_spinbox = ttk.Spinbox(size_frame, from_=12, to=200, width=10,
-                                 textvariable=self.font_size, command=self._on_setting_change)
-      size_spinbox.bind('<KeyRelease>', self._on_setting_change)
-      size_spinbox.bind('<FocusOut>', self._on_setting_change)
-      size_spinbox.pack(side=tk.RIGHT)
-
-      # 字体选择
-      font_frame = ttk.Frame(self.text_frame)
-      font_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(font_frame, text="字体:").pack(side=tk.LEFT)
-      self.font_family = tk.StringVar(value="微软雅黑")
-      self.font_combo = ttk.Combobox(font_frame, textvariable=self.font_family,
-                                     values=self._get_available_fonts(), width=15)
-      self.font_combo.pack(side=tk.RIGHT)
-      self.font_combo.bind('<<ComboboxSelected>>', self._on_setting_change)
-
-      # 重置字体按钮
-      reset_font_frame = ttk.Frame(self.text_frame)
-      reset_font_frame.pack(fill=tk.X, pady=2)
-      ttk.Button(reset_font_frame, text="重置字体设置",
-                 command=self._reset_font_settings).pack()
-
-      # 颜色选择
-      color_frame = ttk.Frame(self.text_frame)
-      color_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(color_frame, text="文字颜色:").pack(side=tk.LEFT)
-      self.text_color = tk.StringVar(value="#FFFFFF")
-      self.color_button = tk.Button(color_frame, text="选择颜色",
-                                    command=self._choose_color, width=12,
-                                    bg="white")
-      self.color_button.pack(side=tk.RIGHT)
-
-      # 透明度
-      opacity_frame = ttk.Frame(self.text_frame)
-      opacity_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(opacity_frame, text="透明度:").pack(side=tk.LEFT)
-      self.opacity = tk.IntVar(value=80)
-      opacity_scale = ttk.Scale(opacity_frame, from_=0, to=100, orient=tk.HORIZONTAL,
-                                variable=self.opacity, command=self._on_setting_change)
-      opacity_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
-
-      # 阴影效果
-      shadow_frame = ttk.Frame(self.text_frame)
-      shadow_frame.pack(fill=tk.X, pady=2)
-      self.shadow_enabled = tk.BooleanVar(value=True)
-      shadow_check = ttk.Checkbutton(
-          shadow_frame, text="开启阴影", variable=self.shadow_enabled, command=self._on_setting_change)
-      shadow_check.pack(side=tk.LEFT)
-
-      # 字体样式（粗体和斜体）
-      style_frame = ttk.Frame(self.text_frame)
-      style_frame.pack(fill=tk.X, pady=2)
-      self.bold_enabled = tk.BooleanVar(value=False)
-      bold_check = ttk.Checkbutton(
-          style_frame, text="粗体", variable=self.bold_enabled, command=self._on_setting_change)
-      bold_check.pack(side=tk.LEFT)
-
-      self.italic_enabled = tk.BooleanVar(value=False)
-      italic_check = ttk.Checkbutton(
-          style_frame, text="斜体", variable=self.italic_enabled, command=self._on_setting_change)
-      italic_check.pack(side=tk.LEFT, padx=(10, 0))
-
-      # 描边设置
-      stroke_frame = ttk.Frame(self.text_frame)
-      stroke_frame.pack(fill=tk.X, pady=2)
-      self.stroke_enabled = tk.BooleanVar(value=False)
-      stroke_check = ttk.Checkbutton(
-          stroke_frame, text="开启描边", variable=self.stroke_enabled, command=self._on_setting_change)
-      stroke_check.pack(side=tk.LEFT)
-
-      # 描边宽度
-      ttk.Label(stroke_frame, text="宽度:").pack(side=tk.LEFT, padx=(10, 5))
-      self.stroke_width = tk.IntVar(value=2)
-      stroke_width_spinbox = ttk.Spinbox(stroke_frame, from_=1, to=10, width=5,
-                                         textvariable=self.stroke_width, command=self._on_setting_change)
-      stroke_width_spinbox.pack(side=tk.LEFT)
-      stroke_width_spinbox.bind('<KeyRelease>', self._on_setting_change)
-      stroke_width_spinbox.bind('<FocusOut>', self._on_setting_change)
-
-      # 图片水印设置（初始隐藏）
       self.image_frame = ttk.LabelFrame(main_frame, text="图片设置")
-
-      ttk.Label(self.image_frame, text="水印图片路径:").pack(anchor=tk.W)
-      path_frame = ttk.Frame(self.image_frame)
-      path_frame.pack(fill=tk.X, pady=2)
-      self.image_path = tk.StringVar()
-      ttk.Entry(path_frame, textvariable=self.image_path, state='readonly').pack(
-          side=tk.LEFT, fill=tk.X, expand=True)
-      ttk.Button(path_frame, text="浏览", command=self._browse_image).pack(
-          side=tk.RIGHT, padx=2)
-
-      # 图片水印尺寸控制
-      size_frame = ttk.Frame(self.image_frame)
-      size_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(size_frame, text="尺寸比例:").pack(side=tk.LEFT)
-      self.image_scale = tk.IntVar(value=25)  # 默认25%
-      scale_spinbox = ttk.Spinbox(size_frame, from_=10, to=100, width=10,
-                                  textvariable=self.image_scale,
-                                  command=self._on_setting_change)
-      scale_spinbox.bind('<KeyRelease>', self._on_setting_change)
-      scale_spinbox.bind('<FocusOut>', self._on_setting_change)
-      scale_spinbox.pack(side=tk.RIGHT)
-      ttk.Label(size_frame, text="%").pack(side=tk.RIGHT)
-
-      # 图片水印透明度
-      img_opacity_frame = ttk.Frame(self.image_frame)
-      img_opacity_frame.pack(fill=tk.X, pady=2)
-      ttk.Label(img_opacity_frame, text="透明度:").pack(side=tk.LEFT)
-      self.image_opacity = tk.IntVar(value=90)
-      img_opacity_scale = ttk.Scale(img_opacity_frame, from_=0, to=100, orient=tk.HORIZONTAL,
-                                    variable=self.image_opacity, command=self._on_setting_change)
-      img_opacity_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
+      self._text_built = False
+      self._image_built = False
+      # 当前已布局的水印类型
+      self._last_type = None
 
       # 初始显示文本设置
       self._on_type_change()
@@ -190,65 +111,256 @@ class WatermarkControlPanel:
     except Exception as e:
       self.logger.error(f"创建水印控制界面失败: {str(e)}")
 
+  def _create_variables(self):
+    """创建设置变量并注册写入追踪"""
+    self.watermark_type = tk.StringVar(value="text")
+
+    # 文本水印设置
+    self.text_content = tk.StringVar(value="水印文本")
+    self.font_size = tk.IntVar(value=36)
+    self.font_family = tk.StringVar(value="微软雅黑")
+    self.text_color = tk.StringVar(value="#FFFFFF")
+    self.opacity = tk.IntVar(value=80)
+    self.shadow_enabled = tk.BooleanVar(value=True)
+    self.bold_enabled = tk.BooleanVar(value=False)
+    self.italic_enabled = tk.BooleanVar(value=False)
+    self.stroke_enabled = tk.BooleanVar(value=False)
+    self.stroke_width = tk.IntVar(value=2)
+
+    # 图片水印设置
+    self.image_path = tk.StringVar()
+    self.image_scale = tk.IntVar(value=25)  # 默认25%
+    self.image_opacity = tk.IntVar(value=90)
+
+    # 每个设置变量对应的配置项：Tcl变量名 -> (变量, 分组, 键, 除数, 通知延时)。
+    # 写入时只更新缓存配置中的这一项；通知延时为None的变量由控件的command
+    # 回调通知，文本内容、字体大小和两个透明度滑块没有command回调，由写入通知
+    text_delay, slider_delay = self._TEXT_DELAY_MS, self._SLIDER_DELAY_MS
+    self._config_fields = {
+        str(field[0]): field
+        for field in (
+            (self.watermark_type, None, 'type', None, None),
+            (self.text_content, 'text', 'content', None, text_delay),
+            (self.font_family, 'text', 'font_family', None, None),
+            (self.font_size, 'text', 'font_size', None, slider_delay),
+            (self.text_color, 'text', 'color', None, None),
+            (self.opacity, 'text', 'opacity', 100.0, slider_delay),
+            (self.shadow_enabled, 'text', 'shadow_enabled', None, None),
+            (self.stroke_enabled, 'text', 'stroke_enabled', None, None),
+            (self.stroke_width, 'text', 'stroke_width', None, None),
+            (self.bold_enabled, 'text', 'bold', None, None),
+            (self.italic_enabled, 'text', 'italic', None, None),
+            (self.image_path, 'image', 'path', None, None),
+            (self.image_scale, 'image', 'scale', 100.0, None),
+            (self.image_opacity, 'image', 'opacity', 100.0, slider_delay),
+        )
+    }
+
+    # 每个设置变量只注册一个写入追踪，统一由_on_var_write按上表分派
+    for var, *_ in self._config_fields.values():
+      var.trace_add('write', self._on_var_write)
+
+    # get_config按上表顺序用一次Tcl调用读取全部变量，避免逐个get()往返解释器
+    self._config_vars = tuple(
+        field[0] for field in self._config_fields.values())
+    self._config_read_script = 'list ' + ' '.join(
+        '[set {%s}]' % var for var in self._config_vars)
+
+  def _build_text_widgets(self, parent: ttk.Frame):
+    """构建文本水印设置控件"""
+    # 文本内容
+    ttk.Label(parent, text="文本内容:").pack(anchor=tk.W)
+    self.text_entry = ttk.Entry(parent, width=30,
+                                textvariable=self.text_content)
+    self.text_entry.pack(fill=tk.X, pady=2)
+    # 回车或离开输入框时立即提交尚未触发的文本变更
+    self.text_entry.bind('<Return>', self._flush_notify)
+    self.text_entry.bind('<FocusOut>', self._flush_notify)
+
+    # 字体大小
+    size_frame = ttk.Frame(parent)
+    size_frame.pack(fill=tk.X, pady=2)
+    ttk.Label(size_frame, text="字体大小:").pack(side=tk.LEFT)
+    size_spinbox = ttk.Spinbox(size_frame, from_=12, to=200, width=10,
+                               textvariable=self.font_size)
+    size_spinbox.pack(side=tk.RIGHT)
+
+    # 字体选择
+    font_frame = ttk.Frame(parent)
+    font_frame.pack(fill=tk.X, pady=2)
+    ttk.Label(font_frame, text="字体:").pack(side=tk.LEFT)
+    self.font_combo = ttk.Combobox(font_frame, textvariable=self.font_family,
+                                   values=self._get_available_fonts(), width=15)
+    self.font_combo.pack(side=tk.RIGHT)
+    self.font_combo.bind('<<ComboboxSelected>>', self._on_discrete_change)
+
+    # 重置字体按钮
+    reset_font_frame = ttk.Frame(parent)
+    reset_font_frame.pack(fill=tk.X, pady=2)
+    ttk.Button(reset_font_frame, text="重置字体设置",
+               command=self._reset_font_settings).pack()
+
+    # 颜色选择（按钮可能晚于load_config构建，背景取当前颜色）
+    color_frame = ttk.Frame(parent)
+    color_frame.pack(fill=tk.X, pady=2)
+    ttk.Label(color_frame, text="文字颜色:").pack(side=tk.LEFT)
+    self._color_button_bg = self.text_color.get()
+    self.color_button = tk.Button(color_frame, text="选择颜色",
+                                  command=self._choose_color, width=12,
+                                  bg=self._color_button_bg)
+    self.color_button.pack(side=tk.RIGHT)
+
+    # 透明度
+    opacity_frame = ttk.Frame(parent)
+    opacity_frame.pack(fill=tk.X, pady=2)
+    ttk.Label(opacity_frame, text="透明度:").pack(side=tk.LEFT)
+    opacity_scale = ttk.Scale(opacity_frame, from_=0, to=100, orient=tk.HORIZONTAL,
+                              variable=self.opacity)
+    opacity_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
+    self._bind_drag(opacity_scale)
+
+    # 阴影效果
+    shadow_frame = ttk.Frame(parent)
+    shadow_frame.pack(fill=tk.X, pady=2)
+    shadow_check = ttk.Checkbutton(
+        shadow_frame, text="开启阴影", variable=self.shadow_enabled, command=self._on_discrete_change)
+    shadow_check.pack(side=tk.LEFT)
+
+    # 字体样式（粗体和斜体）
+    style_frame = ttk.Frame(parent)
+    style_frame.pack(fill=tk.X, pady=2)
+    bold_check = ttk.Checkbutton(
+        style_frame, text="粗体", variable=self.bold_enabled, command=self._on_discrete_change)
+    bold_check.pack(side=tk.LEFT)
+
+    italic_check = ttk.Checkbutton(
+        style_frame, text="斜体", variable=self.italic_enabled, command=self._on_discrete_change)
+    italic_check.pack(side=tk.LEFT, padx=(10, 0))
+
+    # 描边设置（宽度控件在首次开启描边时才构建）
+    self._stroke_frame = ttk.Frame(parent)
+    self._stroke_frame.pack(fill=tk.X, pady=2)
+    stroke_check = ttk.Checkbutton(
+        self._stroke_frame, text="开启描边", variable=self.stroke_enabled,
+        command=self._on_stroke_toggle)
+    stroke_check.pack(side=tk.LEFT)
+    self._sync_stroke_widgets()
+
+  def _build_stroke_width_widgets(self, parent: ttk.Frame):
+    """构建描边宽度控件"""
+    ttk.Label(parent, text="宽度:").pack(side=tk.LEFT, padx=(10, 5))
+    stroke_width_spinbox = ttk.Spinbox(parent, from_=1, to=10, width=5,
+                                       textvariable=self.stroke_width, command=self._on_setting_change)
+    stroke_width_spinbox.pack(side=tk.LEFT)
+    # 键盘输入时不逐键通知，回车或离开输入框时再通知
+    stroke_width_spinbox.bind('<Return>', self._on_setting_change)
+    stroke_width_spinbox.bind('<FocusOut>', self._on_setting_change)
+
+  def _sync_stroke_widgets(self):
+    """按描边开关显示或隐藏描边宽度控件，首次开启时构建"""
+    if self._stroke_frame is None:
+      return
+    if self.stroke_enabled.get():
+      if self._stroke_width_frame is None:
+        self._stroke_width_frame = ttk.Frame(self._stroke_frame)
+        self._build_stroke_width_widgets(self._stroke_width_frame)
+      self._stroke_width_frame.pack(side=tk.LEFT)
+    elif self._stroke_width_frame is not None:
+      self._stroke_width_frame.pack_forget()
+
+  def _on_stroke_toggle(self):
+    """描边开关改变"""
+    self._sync_stroke_widgets()
+    self._on_discrete_change()
+
+  def _build_image_widgets(self, parent: ttk.Frame):
+    """构建图片水印设置控件"""
+    ttk.Label(parent, text="水印图片路径:").pack(anchor=tk.W)
+    path_frame = ttk.Frame(parent)
+    path_frame.pack(fill=tk.X, pady=2)
+    ttk.Entry(path_frame, textvariable=self.image_path, state='readonly').pack(
+        side=tk.LEFT, fill=tk.X, expand=True)
+    ttk.Button(path_frame, text="浏览", command=self._browse_image).pack(
+        side=tk.RIGHT, padx=2)
+
+    # 图片水印尺寸控制
+    size_frame = ttk.Frame(parent)
+    size_frame.pack(fill=tk.X, pady=2)
+    ttk.Label(size_frame, text="尺寸比例:").pack(side=tk.LEFT)
+    scale_spinbox = ttk.Spinbox(size_frame, from_=10, to=100, width=10,
+                                textvariable=self.image_scale,
+                                command=self._on_setting_change)
+    scale_spinbox.bind('<Return>', self._on_setting_change)
+    scale_spinbox.bind('<FocusOut>', self._on_setting_change)
+    scale_spinbox.pack(side=tk.RIGHT)
+    ttk.Label(size_frame, text="%").pack(side=tk.RIGHT)
+
+    # 图片水印透明度
+    img_opacity_frame = ttk.Frame(parent)
+    img_opacity_frame.pack(fill=tk.X, pady=2)
+    ttk.Label(img_opacity_frame, text="透明度:").pack(side=tk.LEFT)
+    img_opacity_scale = ttk.Scale(img_opacity_frame, from_=0, to=100, orient=tk.HORIZONTAL,
+                                  variable=self.image_opacity)
+    img_opacity_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
+    self._bind_drag(img_opacity_scale)
+
   def _on_type_change(self):
-    """水印类型改变"""
+    """水印类型改变（对应设置框的控件在首次显示时构建，类型未变时不重新布局）"""
     try:
-      if self.watermark_type.get() == "text":
+      watermark_type = self.watermark_type.get()
+      if watermark_type == self._last_type:
+        return
+      self._last_type = watermark_type
+
+      if watermark_type == "text":
+        if not self._text_built:
+          self._build_text_widgets(self.text_frame)
+          self._text_built = True
         self.text_frame.pack(fill=tk.X, pady=5)
         self.image_frame.pack_forget()
       else:
+        if not self._image_built:
+          self._build_image_widgets(self.image_frame)
+          self._image_built = True
         self.text_frame.pack_forget()
         self.image_frame.pack(fill=tk.X, pady=5)
 
-      self._notify_change()
+      self._notify_change(delay=self._DISCRETE_DELAY_MS)
     except Exception as e:
       self.logger.error(f"处理水印类型改变失败: {str(e)}")
 
-  def _on_text_change(self, event=None):
-    """文本改变"""
-    self._notify_change()
-
   def _on_setting_change(self, event=None):
     """设置改变"""
     self._notify_change()
 
+  def _on_discrete_change(self, event=None):
+    """离散设置（复选框、下拉框）改变，立即通知"""
+    self._notify_change(delay=self._DISCRETE_DELAY_MS)
+
   def _get_available_fonts(self):
-    """获取系统所有可用字体列表（跨平台）"""
+    """获取系统所有可用字体列表（跨平台，首次枚举后缓存）"""
+    global _FONT_CACHE
+    if _FONT_CACHE is not None:
+      return _FONT_CACHE
     try:
-      # 获取Tkinter的系统字体列表
-      system_fonts = sorted(list(font.families()))
-
-      # 过滤掉以@开头的字体（这些通常是特殊的旋转字体）
-      filtered_fonts = [f for f in system_fonts if not f.startswith('@')]
 
-      # 优先显示常用字体
-      common_fonts = []
+      # 获取Tkinter的系统字体列表，过滤掉以@开头的字体（这些通常是特殊的旋转字体）
+      available = {f for f in font.families() if not f.startswith('@')}
+      filtered_fonts = sorted(available)
 
-      # 根据平台设置优先字体
-      if platform.system() == "Windows":
-        priority_fonts = ['微软雅黑', '宋体', 'Arial', 'Times New Roman', 'Calibri']
-      elif platform.system() == "Darwin":  # macOS
-        priority_fonts = ['苹方-简', 'Helvetica', 'Times', 'Arial']
-      else:  # Linux
-        priority_fonts = ['Noto Sans CJK SC',
-                          'DejaVu Sans', 'Liberation Sans', 'Arial']
+      # 先添加当前平台的优先字体，再添加其他字体
+      common_fonts = [f for f in _PRIORITY_FONTS if f in available]
+      priority_set = set(common_fonts)
+      common_fonts += [f for f in filtered_fonts if f not in priority_set]
 
-      # 先添加优先字体
-      for font_name in priority_fonts:
-        if font_name in filtered_fonts:
-          common_fonts.append(font_name)
-
-      # 添加其他字体
-      for font_name in filtered_fonts:
-        if font_name not in common_fonts:
-          common_fonts.append(font_name)
-
-      return common_fonts if common_fonts else ['Arial', 'Helvetica', 'Sans']
+      result = common_fonts if common_fonts else _FALLBACK_FONTS
+      _FONT_CACHE = result
+      return result
 
     except Exception as e:
       self.logger.error(f"获取系统字体失败: {e}")
       # 返回基本的备用字体
-      return ['Arial', 'Helvetica', 'Times New Roman', 'Courier New']
+      return _ERROR_FALLBACK_FONTS
 
   def _choose_color(self):
     """选择颜色"""
@@ -263,155 +375,266 @@ class WatermarkControlPanel:
       color = colorchooser.askcolor(initialcolor=initial_color)
       if color[1]:  # 用户选择了颜色
         self.text_color.set(color[1])
-        self.color_button.config(bg=color[1])
-        self._notify_change()
+        self._paint_color_button(color[1])
+        self._notify_change(delay=self._DISCRETE_DELAY_MS)
     except Exception as e:
       self.logger.error(f"选择颜色失败: {str(e)}")
 
+  def _paint_color_button(self, color: str):
+    """颜色按钮已创建且颜色确实改变时才更新其背景"""
+    if self.color_button is None or color == self._color_button_bg:
+      return
+    self.color_button.config(bg=color)
+    self._color_button_bg = color
+
   def _browse_image(self):
     """浏览图片"""
     from tkinter import filedialog
     try:
       file_path = filedialog.askopenfilename(
           title="选择水印图片",
-          filetypes=[
-              ("图片文件", "*.png *.jpg *.jpeg *.bmp *.tiff"),
-              ("PNG文件", "*.png"),
-              ("所有文件", "*.*")
-          ]
+          filetypes=WATERMARK_IMAGE_FILETYPES
       )
       if file_path:
         self.image_path.set(file_path)
-        self._notify_change()
+        self._notify_change(delay=self._DISCRETE_DELAY_MS)
     except Exception as e:
       self.logger.error(f"浏览图片失败: {str(e)}")
 
   def _reset_font_settings(self):
     """重置字体设置"""
     try:
-      # 从 config_manager 获取默认值
-      if self.config_manager:
-        from ...core.config_manager import ConfigManager
-        default_text = ConfigManager.DEFAULT_CONFIG['watermark']['text']
-
-        # 重置为默认值
-        self.font_family.set(default_text.get('font_family', 'arial'))
-        self.font_size.set(default_text.get('font_size', 36))
-
-        # 处理颜色，从 RGBA 数组转换为十六进制
-        color_rgba = default_text.get('color', [255, 255, 255, 128])
-        color_hex = '#{:02x}{:02x}{:02x}'.format(
-            color_rgba[0], color_rgba[1], color_rgba[2])
-        opacity = int((color_rgba[3] / 255.0) *
-                      100) if len(color_rgba) > 3 else 80
-
-        self.text_color.set(color_hex)
-        self.color_button.config(bg=color_hex)
-        self.opacity.set(opacity)
-
-        self.shadow_enabled.set(default_text.get('shadow', False))
-        self.bold_enabled.set(default_text.get('bold', False))
-        self.italic_enabled.set(default_text.get('italic', False))
-        self.stroke_enabled.set(False)  # 默认配置中没有stroke_enabled，使用False
-        self.stroke_width.set(default_text.get('stroke_width', 1))
-      else:
-        # 备用：如果没有 config_manager，使用硬编码默认值
-        self.font_family.set("arial")
-        self.font_size.set(36)
-        self.text_color.set("#FFFFFF")
-        self.color_button.config(bg="#FFFFFF")
-        self.opacity.set(50)
-        self.shadow_enabled.set(False)
-        self.bold_enabled.set(False)
-        self.italic_enabled.set(False)
-        self.stroke_enabled.set(False)
-        self.stroke_width.set(1)
-
-      self._notify_change()
+      self._suspend_notify = True
+      try:
+        # 从 config_manager 获取默认值
+        if self.config_manager:
+          from ...core.config_manager import ConfigManager
+          default_text = ConfigManager.DEFAULT_CONFIG['watermark']['text']
+
+          # 重置为默认值
+          self.font_family.set(default_text.get('font_family', 'arial'))
+          self.font_size.set(default_text.get('font_size', 36))
+
+          # 处理颜色，从 RGBA 数组转换为十六进制
+          color_rgba = default_text.get('color', [255, 255, 255, 128])
+          r, g, b = color_rgba[:3]
+          color_hex = f'#{r:02x}{g:02x}{b:02x}'
+          opacity = color_rgba[3] * 100 // 255 if len(color_rgba) > 3 else 80
+
+          self.text_color.set(color_hex)
+          self.opacity.set(opacity)
+
+          self.shadow_enabled.set(default_text.get('shadow', False))
+          self.bold_enabled.set(default_text.get('bold', False))
+          self.italic_enabled.set(default_text.get('italic', False))
+          self.stroke_enabled.set(False)  # 默认配置中没有stroke_enabled，使用False
+          self.stroke_width.set(default_text.get('stroke_width', 1))
+        else:
+          # 备用：如果没有 config_manager，使用硬编码默认值
+          self.font_family.set("arial")
+          self.font_size.set(36)
+          self.text_color.set("#FFFFFF")
+          self.opacity.set(50)
+          self.shadow_enabled.set(False)
+          self.bold_enabled.set(False)
+          self.italic_enabled.set(False)
+          self.stroke_enabled.set(False)
+          self.stroke_width.set(1)
+      finally:
+        self._suspend_notify = False
+
+      self._paint_color_button(self.text_color.get())
+      self._sync_stroke_widgets()
+      self._notify_change(delay=self._DISCRETE_DELAY_MS)
     except Exception as e:
       self.logger.error(f"重置字体设置失败: {str(e)}")
 
-  def _notify_change(self):
-    """通知改变"""
+  def _on_var_write(self, name: str, *args):
+    """
+    设置变量写入：更新缓存配置中对应的一项，需要时防抖通知改变
+
+    Args:
+        name: 写入的Tcl变量名
+    """
+    var, section, key, divisor, notify_delay = self._config_fields[name]
+    self._update_config_field(var, section, key, divisor)
+    if notify_delay is not None:
+      self._notify_change(delay=notify_delay)
+
+  def _update_config_field(self, var: tk.Variable, section: Optional[str],
+                           key: str, divisor: Optional[float]):
+    """
+    只更新缓存配置中的一项
+
+    get_config返回的是浅拷贝，调用方可能仍持有旧的分组字典，
+    因此分组字典整体替换而不是原地修改。
+    """
+    config = self._config_cache
+    if config is None:
+      return
+    try:
+      value = var.get()
+    except (tk.TclError, ValueError):
+      # 输入框中暂时为非法值，下次get_config时整体重建
+      self._config_cache = None
+      return
+    if divisor:
+      value = value / divisor
+    if section is None:
+      config[key] = value
+    else:
+      group = dict(config[section])
+      group[key] = value
+      config[section] = group
+
+  def _notify_change(self, *args, delay: int = _SLIDER_DELAY_MS):
+    """通知改变（防抖，拖动滑块、连续输入或连续操作时合并为一次通知）"""
+    if self._suspend_notify:
+      return
+    if self._change_after_id:
+      self.parent.after_cancel(self._change_after_id)
+    self._change_after_id = self.parent.after(delay, self._fire_notify)
+
+  def _flush_notify(self, event=None):
+    """立即触发尚在防抖等待中的变更通知"""
+    if self._change_after_id:
+      self.parent.after_cancel(self._change_after_id)
+      self._fire_notify()
+
+  def _fire_notify(self):
+    """触发水印改变回调"""
+    self._change_after_id = None
     if self.on_watermark_change:
       self.on_watermark_change()
 
+  def _bind_drag(self, scale: ttk.Scale):
+    """记录滑块的拖动状态"""
+    scale.bind('<ButtonPress-1>', self._on_drag_start, add='+')
+    scale.bind('<ButtonRelease-1>', self._on_drag_end, add='+')
+
+  def _on_drag_start(self, event=None):
+    """开始拖动滑块"""
+    self._dragging = True
+
+  def _on_drag_end(self, event=None):
+    """结束拖动滑块，立即通知以按原图分辨率重新渲染预览"""
+    self._dragging = False
+    if self._change_after_id:
+      self.parent.after_cancel(self._change_after_id)
+    self._fire_notify()
+
+  def is_dragging(self) -> bool:
+    """是否正在拖动滑块"""
+    return self._dragging
+
   def get_config(self) -> Dict[str, Any]:
-    """获取当前配置"""
+    """获取当前配置（设置未变化时返回缓存配置的浅拷贝）"""
     try:
-      config = {
-          'type': self.watermark_type.get(),
-          'text': {
-              'content': self.text_entry.get(),
-              'font_family': self.font_family.get(),
-              'font_size': self.font_size.get(),
-              'color': self.text_color.get(),
-              'opacity': self.opacity.get() / 100.0,
-              'shadow_enabled': self.shadow_enabled.get(),
-              'stroke_enabled': self.stroke_enabled.get(),
-              'stroke_width': self.stroke_width.get(),
-              'bold': self.bold_enabled.get(),
-              'italic': self.italic_enabled.get()
-          },
-          'image': {
-              'path': self.image_path.get(),
-              'scale': self.image_scale.get() / 100.0,
-              'opacity': self.image_opacity.get() / 100.0
-          }
-      }
-      return config
+      if self._config_cache is None:
+        self._config_cache = self._build_config()
+      return dict(self._config_cache)
     except Exception as e:
       self.logger.error(f"获取配置失败: {str(e)}")
       return {}
 
+  def _read_variables(self) -> List[Any]:
+    """一次Tcl调用读取全部设置变量，并按变量类型转换取值"""
+    tcl = self.parent.tk
+    raw_values = tcl.splitlist(tcl.eval(self._config_read_script))
+    values = []
+    for var, raw in zip(self._config_vars, raw_values):
+      if isinstance(var, tk.BooleanVar):
+        values.append(tcl.getboolean(raw))
+      elif isinstance(var, tk.IntVar):
+        # 与IntVar.get()一致：滑块写入的可能是浮点字符串
+        try:
+          values.append(tcl.getint(raw))
+        except (TypeError, tk.TclError):
+          values.append(int(tcl.getdouble(raw)))
+      else:
+        values.append(raw)
+    return values
+
+  def _build_config(self) -> Dict[str, Any]:
+    """从设置变量读取并构建配置字典"""
+    (watermark_type, content, font_family, font_size, color, opacity,
+     shadow_enabled, stroke_enabled, stroke_width, bold, italic,
+     image_path, image_scale, image_opacity) = self._read_variables()
+    return {
+        'type': watermark_type,
+        'text': {
+            'content': content,
+            'font_family': font_family,
+            'font_size': font_size,
+            'color': color,
+            'opacity': opacity / 100.0,
+            'shadow_enabled': shadow_enabled,
+            'stroke_enabled': stroke_enabled,
+            'stroke_width': stroke_width,
+            'bold': bold,
+            'italic': italic
+        },
+        'image': {
+            'path': image_path,
+            'scale': image_scale / 100.0,
+            'opacity': image_opacity / 100.0
+        }
+    }
+
   def load_config(self, config: Dict[str, Any]):
     """载入配置"""
     try:
-      if 'type' in config:
-        self.watermark_type.set(config['type'])
-
-      if 'text' in config:
-        text_config = config['text']
-        if 'content' in text_config:
-          self.text_entry.delete(0, tk.END)
-          self.text_entry.insert(0, text_config['content'])
-        if 'font_family' in text_config:
-          self.font_family.set(text_config['font_family'])
-        if 'font_size' in text_config:
-          self.font_size.set(text_config['font_size'])
-        if 'color' in text_config:
-          color_value = text_config['color']
-          if isinstance(color_value, str) and color_value.startswith('#'):
-            self.text_color.set(color_value)
-            if hasattr(self, 'color_button'):
-              self.color_button.config(bg=color_value)
-          else:
-            self.text_color.set('#FFFFFF')
-            if hasattr(self, 'color_button'):
-              self.color_button.config(bg='#FFFFFF')
-        if 'opacity' in text_config:
-          self.opacity.set(int(text_config['opacity'] * 100))
-        if 'shadow_enabled' in text_config:
-          self.shadow_enabled.set(text_config['shadow_enabled'])
-        if 'stroke_enabled' in text_config:
-          self.stroke_enabled.set(text_config['stroke_enabled'])
-        if 'stroke_width' in text_config:
-          self.stroke_width.set(text_config['stroke_width'])
-        if 'bold' in text_config:
-          self.bold_enabled.set(text_config['bold'])
-        if 'italic' in text_config:
-          self.italic_enabled.set(text_config['italic'])
-
-      if 'image' in config:
-        image_config = config['image']
-        if 'path' in image_config:
-          self.image_path.set(image_config['path'])
-        if 'scale' in image_config:
-          self.image_scale.set(int(image_config['scale'] * 100))
-        if 'opacity' in image_config:
-          self.image_opacity.set(int(image_config['opacity'] * 100))
-
+      # 逐项设置变量时不触发通知，载入完成后统一刷新颜色按钮并通知一次
+      self._suspend_notify = True
+      try:
+        if 'type' in config:
+          self.watermark_type.set(config['type'])
+
+        if 'text' in config:
+          text_config = config['text']
+          if 'content' in text_config:
+            self.text_content.set(text_config['content'])
+          if 'font_family' in text_config:
+            self.font_family.set(text_config['font_family'])
+          if 'font_size' in text_config:
+            self.font_size.set(text_config['font_size'])
+          if 'color' in text_config:
+            color_value = text_config['color']
+            if isinstance(color_value, str) and color_value.startswith('#'):
+              self.text_color.set(color_value)
+            else:
+              self.text_color.set('#FFFFFF')
+          if 'opacity' in text_config:
+            self.opacity.set(int(text_config['opacity'] * 100))
+          if 'shadow_enabled' in text_config:
+            self.shadow_enabled.set(text_config['shadow_enabled'])
+          if 'stroke_enabled' in text_config:
+            self.stroke_enabled.set(text_config['stroke_enabled'])
+          if 'stroke_width' in text_config:
+            self.stroke_width.set(text_config['stroke_width'])
+          if 'bold' in text_config:
+            self.bold_enabled.set(text_config['bold'])
+          if 'italic' in text_config:
+            self.italic_enabled.set(text_config['italic'])
+
+        if 'image' in config:
+          image_config = config['image']
+          if 'path' in image_config:
+            self.image_path.set(image_config['path'])
+          if 'scale' in image_config:
+            self.image_scale.set(int(image_config['scale'] * 100))
+          if 'opacity' in image_config:
+            self.image_opacity.set(int(image_config['opacity'] * 100))
+      finally:
+        self._suspend_notify = False
+
+      self._paint_color_button(self.text_color.get())
+      self._sync_stroke_widgets()
+      # 类型未变时_on_type_change不会通知，这里统一通知一次；同步触发，
+      # 使调用方的批量更新能把它与其他面板的变更合并为一次预览刷新
       self._on_type_change()
+      self._notify_change()
+      self._flush_notify()
 
     except Exception as e:
       self.logger.error(f"载入配置失败: {str(e)}")
@@ -5,7 +5,5 @@
 """
 
 from .logger import setup_logger
-from .helpers import *
-from .constants import *
 
 __all__ = ['setup_logger']
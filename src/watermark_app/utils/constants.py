@@ -15,17 +15,34 @@ DEFAULT_WINDOW_SIZE = (1200, 800)
 MIN_WINDOW_SIZE = (800, 600)
 DEFAULT_WINDOW_POSITION = (100, 100)
 
-# 文件相关
-SUPPORTED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
-SUPPORTED_MIME_TYPES = {
+# 文件相关（均为小写，比较前先将扩展名/类型转为小写）
+SUPPORTED_IMAGE_EXTENSIONS = frozenset(
+    {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'})
+SUPPORTED_MIME_TYPES = frozenset({
     'image/jpeg', 'image/jpg', 'image/png',
     'image/bmp', 'image/tiff', 'image/x-ms-bmp'
-}
+})
+
+# 文件对话框的文件类型过滤
+IMPORT_IMAGE_FILETYPES = (
+    ("图片文件", "*.jpg *.jpeg *.png *.bmp *.tiff"),
+    ("JPEG文件", "*.jpg *.jpeg"),
+    ("PNG文件", "*.png"),
+    ("BMP文件", "*.bmp"),
+    ("TIFF文件", "*.tiff"),
+    ("所有文件", "*.*")
+)
+WATERMARK_IMAGE_FILETYPES = (
+    ("图片文件", "*.png *.jpg *.jpeg *.bmp *.tiff"),
+    ("PNG文件", "*.png"),
+    ("所有文件", "*.*")
+)
 
 # 图像处理
 MAX_IMAGE_SIZE = (5000, 5000)  # 最大图像尺寸
 THUMBNAIL_SIZE = (150, 150)    # 缩略图尺寸
 PREVIEW_SIZE = (800, 600)      # 预览图尺寸
+WATERMARK_CACHE_SIZE = 8       # 水印图块缓存数量
 
 # 水印设置
 DEFAULT_WATERMARK_TEXT = "水印文本"
@@ -7,13 +7,51 @@
 
 import os
 import platform
+import json
 import logging
-from typing import Dict, Optional, Tuple
+import re
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+def _user_cache_dir() -> Path:
+  """获取当前用户自己的缓存目录（不使用所有用户都可写的临时目录）"""
+  system = platform.system()
+  if system == "Windows":
+    base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~/AppData/Local')
+  elif system == "Darwin":
+    base = os.path.expanduser('~/Library/Caches')
+  else:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+  return Path(base) / 'watermark_app'
+
+
+# 字体映射表的磁盘缓存，字体目录（及Windows字体注册表）未变化时直接载入
+_CACHE_FILE = _user_cache_dir() / 'font_map.json'
+# 映射表结构或解析规则改变时递增，使旧缓存失效
+_CACHE_VERSION = 2
+
+# 注册表字体名称中的样式关键词（区分大小写的子串匹配）
+_NAME_BOLD_RE = re.compile(r'Bold|Heavy|Black')
+_NAME_LIGHT_RE = re.compile(r'Light|Thin')
+_NAME_ITALIC_RE = re.compile(r'Italic|Oblique')
+# 提取字体族名时去掉的样式词汇（连同前面的一个空格）
+_NAME_STYLE_RE = re.compile(
+    r' ?(?:Bold|Italic|Regular|Normal|Heavy|Black|Light|Thin|Oblique|Ultra|Semi|Demi|Extra)')
+
+# 字体文件名中的样式关键词（对小写文件名匹配）
+_FILE_BOLD_RE = re.compile(r'bold|bd|heavy|black')
+_FILE_ITALIC_RE = re.compile(r'italic|it|oblique|slant')
+# 提取字体族名时去掉的样式词汇，匹配全小写、全大写和首字母大写三种写法
+_FILE_STYLE_RE = re.compile('|'.join(
+    form
+    for pattern in ('bold', 'bd', 'italic', 'it', 'oblique', 'slant',
+                    'regular', 'normal', 'heavy', 'black', 'light')
+    for form in dict.fromkeys((pattern, pattern.upper(), pattern.capitalize()))))
+
+
 class FontMapper:
   """字体映射器 - 将字体显示名称映射到文件路径"""
 
@@ -24,11 +62,20 @@ class FontMapper:
     self.font_variants: Dict[str, Dict[Tuple[bool, bool], str]] = {}
     # 完整的字体映射（保持向后兼容）
     self.font_map: Dict[str, str] = {}
+    # get_font_path的查询结果缓存 {(名称, 粗体, 斜体): 路径}，未找到的None也缓存
+    self._lookup_cache: Dict[Tuple[str, bool, bool], Optional[str]] = {}
     self._build_font_map()
 
   def _build_font_map(self):
-    """构建字体映射表"""
+    """构建字体映射表（字体未变化时从磁盘缓存载入）"""
+    self._lookup_cache.clear()
     try:
+      fingerprint = self._fingerprint()
+      if self._load_cache(fingerprint):
+        logger.info(
+            f"从缓存载入字体映射表: 基础字体 {len(self.base_fonts)} 个, 变体 {sum(len(v) for v in self.font_variants.values())} 个")
+        return
+
       system = platform.system()
       if system == "Windows":
         self._build_windows_font_map()
@@ -40,9 +87,129 @@ class FontMapper:
       logger.info(
           f"构建字体映射表完成: 基础字体 {len(self.base_fonts)} 个, 变体 {sum(len(v) for v in self.font_variants.values())} 个")
 
+      self._save_cache(fingerprint)
+
     except Exception as e:
       logger.error(f"构建字体映射表失败: {e}")
 
+  def _font_dirs(self) -> List[str]:
+    """获取当前系统需要扫描的字体目录"""
+    system = platform.system()
+    if system == "Windows":
+      return [
+          os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),
+          os.path.expanduser("~/AppData/Local/Microsoft/Windows/Fonts/")
+      ]
+    if system == "Darwin":
+      return [
+          "/System/Library/Fonts/",
+          "/Library/Fonts/",
+          os.path.expanduser("~/Library/Fonts/")
+      ]
+    return [
+        "/usr/share/fonts/",
+        "/usr/local/share/fonts/",
+        os.path.expanduser("~/.fonts/"),
+        os.path.expanduser("~/.local/share/fonts/")
+    ]
+
+  def _fingerprint(self) -> list:
+    """
+    计算字体环境指纹：顶层字体目录和fontconfig缓存目录的修改时间，
+    Windows下另加字体注册表项的最后修改时间
+
+    只stat顶层目录而不遍历子目录，否则命中缓存也省不下目录读取的系统调用；
+    安装字体的包一般会刷新fontconfig缓存，直接放入子目录且未运行fc-cache
+    的字体要等顶层目录变化后才会被发现
+
+    Returns:
+        可直接写入JSON并比较的指纹列表
+    """
+    system = platform.system()
+    watched_dirs = self._font_dirs()
+    if system not in ("Windows", "Darwin"):
+      watched_dirs = watched_dirs + [
+          "/var/cache/fontconfig",
+          os.path.expanduser("~/.cache/fontconfig")
+      ]
+
+    dir_mtimes = []
+    for watched_dir in watched_dirs:
+      try:
+        dir_mtimes.append([watched_dir, os.stat(watched_dir).st_mtime_ns])
+      except OSError:
+        continue
+
+    registry_mtime = None
+    if system == "Windows":
+      try:
+        import winreg
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                            r'SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts') as key:
+          registry_mtime = winreg.QueryInfoKey(key)[2]
+      except Exception:
+        registry_mtime = None
+
+    return [_CACHE_VERSION, system, registry_mtime, dir_mtimes]
+
+  def _load_cache(self, fingerprint: list) -> bool:
+    """
+    从磁盘缓存载入字体映射表
+
+    Args:
+        fingerprint: 当前字体环境指纹
+
+    Returns:
+        指纹一致并成功载入时返回True
+    """
+    try:
+      with open(_CACHE_FILE, 'r', encoding='utf-8') as f:
+        cached = json.load(f)
+      if cached.get('fingerprint') != fingerprint:
+        return False
+      # 变体键(粗体, 斜体)在JSON中存为"10"这样的两位字符串
+      font_variants = {
+          family: {(key[0] == '1', key[1] == '1'): path
+                   for key, path in variants.items()}
+          for family, variants in cached['font_variants'].items()
+      }
+      self.base_fonts = dict(cached['base_fonts'])
+      self.font_variants = font_variants
+      self.font_map = dict(cached['font_map'])
+      return True
+    except FileNotFoundError:
+      return False
+    except Exception as e:
+      # 缓存损坏或格式不符时重新构建
+      logger.debug(f"读取字体映射缓存失败: {e}")
+      return False
+
+  def _save_cache(self, fingerprint: list):
+    """
+    将字体映射表写入磁盘缓存（先写临时文件再替换）
+
+    Args:
+        fingerprint: 构建时的字体环境指纹
+    """
+    try:
+      _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+      tmp_path = _CACHE_FILE.with_name(_CACHE_FILE.name + '.tmp')
+      font_variants = {
+          family: {f"{int(bold)}{int(italic)}": path
+                   for (bold, italic), path in variants.items()}
+          for family, variants in self.font_variants.items()
+      }
+      with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'fingerprint': fingerprint,
+            'base_fonts': self.base_fonts,
+            'font_variants': font_variants,
+            'font_map': self.font_map
+        }, f, ensure_ascii=False)
+      os.replace(tmp_path, _CACHE_FILE)
+    except Exception as e:
+      logger.debug(f"写入字体映射缓存失败: {e}")
+
   def _build_windows_font_map(self):
     """构建Windows字体映射"""
     try:
@@ -162,24 +329,18 @@ class FontMapper:
     name = font_name.replace(' (TrueType)', '').replace(' (OpenType)', '')
 
     # 检测粗体和斜体（但不包括Light等轻量样式）
-    is_bold = any(keyword in name for keyword in ['Bold', 'Heavy', 'Black']) and not any(
-        light in name for light in ['Light', 'Thin'])
-    is_italic = any(keyword in name for keyword in ['Italic', 'Oblique'])
+    is_bold = bool(_NAME_BOLD_RE.search(name)) and not _NAME_LIGHT_RE.search(name)
+    is_italic = bool(_NAME_ITALIC_RE.search(name))
 
     # 提取字体族名（移除样式词汇）
     family_name = name
-    style_keywords = ['Bold', 'Italic', 'Regular', 'Normal', 'Heavy', 'Black', 'Light', 'Thin', 'Oblique',
-                      'Ultra', 'Semi', 'Demi', 'Extra']
 
     # 特殊处理复合名称（如 "Microsoft YaHei & Microsoft YaHei UI"）
     if '&' in family_name:
       # 取第一个名称
       family_name = family_name.split('&')[0].strip()
 
-    for keyword in style_keywords:
-      family_name = family_name.replace(f' {keyword}', '').replace(keyword, '')
-
-    family_name = family_name.strip()
+    family_name = _NAME_STYLE_RE.sub('', family_name).strip()
 
     return family_name, is_bold, is_italic
 
@@ -224,84 +385,88 @@ class FontMapper:
 
   def _build_macos_font_map(self):
     """构建macOS字体映射"""
-    font_dirs = [
-        "/System/Library/Fonts/",
-        "/Library/Fonts/",
-        os.path.expanduser("~/Library/Fonts/")
-    ]
-
-    for font_dir in font_dirs:
+    for font_dir in self._font_dirs():
       if os.path.exists(font_dir):
         self._scan_font_directory(font_dir)
 
   def _build_linux_font_map(self):
     """构建Linux字体映射"""
-    font_dirs = [
-        "/usr/share/fonts/",
-        "/usr/local/share/fonts/",
-        os.path.expanduser("~/.fonts/"),
-        os.path.expanduser("~/.local/share/fonts/")
-    ]
-
-    for font_dir in font_dirs:
+    for font_dir in self._font_dirs():
       if os.path.exists(font_dir):
         self._scan_font_directory(font_dir)
 
   def _scan_font_directory(self, font_dir: str):
     """扫描字体目录，建立文件名到路径的映射"""
     try:
-      for root, dirs, files in os.walk(font_dir):
-        for file in files:
-          if file.lower().endswith(('.ttf', '.ttc', '.otf')):
-            font_path = os.path.join(root, file)
-            font_name = os.path.splitext(file)[0]
+      # 用scandir逐层展开，目录项自带完整路径和类型信息，无需再拼接路径和stat
+      stack = [font_dir]
+      while stack:
+        current_dir = stack.pop()
+        try:
+          with os.scandir(current_dir) as entries:
+            for entry in entries:
+              if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+              elif entry.name[-4:].lower() in ('.ttf', '.ttc', '.otf'):
+                self._add_font_file(entry.path, entry.name)
+        except OSError as e:
+          logger.debug(f"读取字体目录 {current_dir} 失败: {e}")
 
-            # 添加到完整映射
-            self.font_map[font_name] = font_path
-            self.font_map[file] = font_path
+    except Exception as e:
+      logger.debug(f"扫描字体目录 {font_dir} 失败: {e}")
 
-            # 尝试解析字体族和样式
-            family_name, is_bold, is_italic = self._parse_filename(font_name)
+  def _add_font_file(self, font_path: str, file: str):
+    """
+    把一个字体文件加入映射表
 
-            if family_name:
-              if family_name not in self.font_variants:
-                self.font_variants[family_name] = {}
+    Args:
+        font_path: 字体文件完整路径
+        file: 字体文件名
+    """
+    font_name = file[:-4]
 
-              self.font_variants[family_name][(is_bold, is_italic)] = font_path
+    # 添加到完整映射
+    self.font_map[font_name] = font_path
+    self.font_map[file] = font_path
 
-              # 如果是基础字体，添加到base_fonts
-              if not is_bold and not is_italic:
-                self.base_fonts[family_name] = font_path
+    # 尝试解析字体族和样式
+    family_name, is_bold, is_italic = self._parse_filename(font_name)
 
-    except Exception as e:
-      logger.debug(f"扫描字体目录 {font_dir} 失败: {e}")
+    if family_name:
+      if family_name not in self.font_variants:
+        self.font_variants[family_name] = {}
+
+      self.font_variants[family_name][(is_bold, is_italic)] = font_path
+
+      # 如果是基础字体，添加到base_fonts
+      if not is_bold and not is_italic:
+        self.base_fonts[family_name] = font_path
 
   def _parse_filename(self, filename: str) -> Tuple[str, bool, bool]:
     """从文件名解析字体族名和样式"""
     name_lower = filename.lower()
 
     # 检测样式
-    is_bold = any(keyword in name_lower for keyword in [
-                  'bold', 'bd', 'heavy', 'black'])
-    is_italic = any(keyword in name_lower for keyword in [
-                    'italic', 'it', 'oblique', 'slant'])
-
-    # 提取字体族名
-    family_name = filename
-    style_patterns = ['bold', 'bd', 'italic', 'it', 'oblique',
-                      'slant', 'regular', 'normal', 'heavy', 'black', 'light']
+    is_bold = bool(_FILE_BOLD_RE.search(name_lower))
+    is_italic = bool(_FILE_ITALIC_RE.search(name_lower))
 
-    for pattern in style_patterns:
-      family_name = family_name.replace(pattern, '').replace(
-          pattern.upper(), '').replace(pattern.capitalize(), '')
-
-    # 清理多余的字符
-    family_name = family_name.strip('_-. ')
+    # 提取字体族名，清理多余的字符
+    family_name = _FILE_STYLE_RE.sub('', filename).strip('_-. ')
 
     return family_name if family_name else filename, is_bold, is_italic
 
   def get_font_path(self, font_name: str, bold: bool = False, italic: bool = False) -> Optional[str]:
-    """根据字体名称获取字体文件路径，支持粗体和斜体"""
+    """根据字体名称获取字体文件路径，支持粗体和斜体（同一查询只解析一次）"""
+    key = (font_name, bold, italic)
+    try:
+      return self._lookup_cache[key]
+    except KeyError:
+      font_path = self._resolve_font_path(font_name, bold, italic)
+      self._lookup_cache[key] = font_path
+      return font_path
+
+  def _resolve_font_path(self, font_name: str, bold: bool, italic: bool) -> Optional[str]:
+    """解析字体名称对应的字体文件路径"""
 
     # 1. 首先查找字体族
     family_name = self._find_font_family(font_name)
@@ -7,6 +7,7 @@
 import os
 import sys
 import platform
+from functools import lru_cache
 from typing import Tuple, List, Optional, Any
 from pathlib import Path
 import tkinter as tk
@@ -106,9 +107,10 @@ def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     except Exception:
         return "#FFFFFF"
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """
-    十六进制颜色转换为RGB
+    十六进制颜色转换为RGB（结果按颜色字符串缓存）
     
     Args:
         hex_color: 十六进制颜色字符串